@@ -24,9 +24,9 @@ def load_metadata(config_path: Path) -> dict[str, Any]:
         return {}
 
     try:
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-            return data
+        # Read the whole file in one call and let json decode the bytes
+        data: dict[str, Any] = json.loads(metadata_path.read_bytes())
+        return data
     except (json.JSONDecodeError, IOError):
         # If there's an error reading metadata, start fresh
         return {}
@@ -40,14 +40,7 @@ def save_metadata(config_path: Path, metadata: dict[str, Any]) -> None:
         metadata: Dictionary mapping server names to their metadata
     """
     metadata_path = config_path.parent / METADATA_FILE
-
-    # Ensure parent directory exists
-    metadata_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write metadata
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    _write_json_atomic(metadata_path, metadata)
 
 
 def load_json_config(
@@ -69,9 +62,9 @@ def load_json_config(
         return copy.deepcopy(default_config)
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config: dict[str, Any] = json.load(f)
-            return config
+        # Read the whole file in one call and let json decode the bytes
+        config: dict[str, Any] = json.loads(config_path.read_bytes())
+        return config
     except (json.JSONDecodeError, IOError) as e:
         # If there's an error reading/parsing, return deep copy of default
         import copy
@@ -86,19 +79,33 @@ def save_json_config(config_path: Path, config: dict[str, Any]) -> None:
         config_path: Path to save the configuration file
         config: Configuration dictionary to save
     """
+    _write_json_atomic(config_path, config)
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON data to a file atomically.
+
+    The data is serialized up front and written in a single call to a
+    temporary file, which then replaces the target.
+
+    Args:
+        path: Path of the file to write
+        data: Dictionary to serialize
+    """
+    # Serialize first so an encoding error never leaves a partial temp file
+    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
     # Ensure parent directory exists
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to a temporary file first (atomic write)
-    temp_path = config_path.with_suffix(".tmp")
+    temp_path = path.with_suffix(".tmp")
 
     try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Add trailing newline
+        temp_path.write_text(content, encoding="utf-8")
 
         # Replace the original file atomically
-        temp_path.replace(config_path)
+        temp_path.replace(path)
 
     except Exception:
         # Clean up temp file if something went wrong
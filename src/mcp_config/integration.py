@@ -4,6 +4,7 @@ This module provides high-level functions that bridge server configurations
 and client handlers for setting up MCP servers.
 """
 
+import functools
 import importlib.util
 import shutil
 import sys
@@ -18,6 +19,32 @@ from .utils import (
     validate_required_parameters,
 )
 
+# Directory where this module is installed; it does not change within a process.
+# Go up: integration.py -> mcp_config -> src -> project root
+_MCP_CONFIG_DIR = Path(__file__).parent.parent.parent
+
+# PYTHONPATH values end with a separator on Windows only
+_PYTHONPATH_TRAILING_SEP = "\\" if sys.platform == "win32" else ""
+
+
+def _format_pythonpath(directory: Path) -> str:
+    """Format a directory as a PYTHONPATH value.
+
+    Args:
+        directory: Directory to put on PYTHONPATH
+
+    Returns:
+        PYTHONPATH string, with a trailing separator on Windows
+    """
+    pythonpath = str(directory)
+    # Ensure trailing separator on Windows; endswith("") is always true elsewhere
+    if not pythonpath.endswith(_PYTHONPATH_TRAILING_SEP):
+        pythonpath += _PYTHONPATH_TRAILING_SEP
+    return pythonpath
+
+
+_DEFAULT_PYTHONPATH = _format_pythonpath(_MCP_CONFIG_DIR)
+
 
 def _detect_mcp_config_directory(venv_path: str | None = None) -> Path:
     """Detect the mcp-config installation directory.
@@ -35,13 +62,25 @@ def _detect_mcp_config_directory(venv_path: str | None = None) -> Path:
             return venv_path_obj.parent
 
     # Method 2: Use the directory where this module is installed
-    # Go up from src/mcp_config/integration.py to project root
-    current_file = Path(__file__)
-    mcp_config_dir = (
-        current_file.parent.parent.parent
-    )  # Go up: integration.py -> mcp_config -> src -> project root
+    return _MCP_CONFIG_DIR
 
-    return mcp_config_dir
+
+def _get_pythonpath(venv_path: str | None = None) -> str:
+    """Get the PYTHONPATH value pointing at the mcp-config directory.
+
+    The common case, the directory this module is installed in, reuses the
+    precomputed default instead of formatting it again.
+
+    Args:
+        venv_path: Optional path to virtual environment
+
+    Returns:
+        PYTHONPATH string for the server environment
+    """
+    mcp_config_dir = _detect_mcp_config_directory(venv_path)
+    if mcp_config_dir == _MCP_CONFIG_DIR:
+        return _DEFAULT_PYTHONPATH
+    return _format_pythonpath(mcp_config_dir)
 
 
 def is_command_available(command: str) -> bool:
@@ -197,8 +236,9 @@ def _build_server_config_with_cli_detection(
 
     if command_mode == "cli_command":
         # Try to use CLI command when available
+        venv_path = normalized_params.get("venv_path")
         cli_command = _find_cli_executable(
-            cli_command_name, normalized_params.get("venv_path")
+            cli_command_name, str(venv_path) if venv_path else None
         )
         if cli_command:
             # For filesystem server, don't include python-executable
@@ -249,9 +289,14 @@ def _build_server_config_with_cli_detection(
     }
 
 
+@functools.lru_cache(maxsize=128)
 def _find_cli_executable(command_name: str, venv_path: str | None = None) -> str | None:
     """Find the CLI executable, checking venv first if provided.
 
+    Results are cached per (command_name, venv_path) so repeated lookups do
+    not rescan the venv and PATH. Use ``_find_cli_executable.cache_clear()``
+    when the environment changes.
+
     Args:
         command_name: Name of the command to find (e.g., "mcp-code-checker")
         venv_path: Optional path to virtual environment to check first
@@ -485,13 +530,7 @@ def build_server_config(
     # Use mcp-config directory for PYTHONPATH, not project directory
     # Capture venv_path before server config might modify it
     original_venv_path = normalized_params.get("venv_path")
-    mcp_config_dir = _detect_mcp_config_directory(original_venv_path)
-
-    pythonpath = str(mcp_config_dir)
-    # Ensure trailing separator on Windows
-    if sys.platform == "win32" and not pythonpath.endswith("\\"):
-        pythonpath += "\\"
-    config["env"] = {"PYTHONPATH": pythonpath}
+    config["env"] = {"PYTHONPATH": _get_pythonpath(original_venv_path)}
 
     return config
 
@@ -524,15 +563,20 @@ def generate_client_config(
     if errors:
         raise ValueError(f"Parameter validation failed: {', '.join(errors)}")
 
+    # Collect the provided parameters once; validation and normalization both
+    # walk them. Parameter names are converted to underscore format to match
+    # user_params.
+    provided = [
+        (param, param_key, user_params[param_key])
+        for param in server_config.parameters
+        if (param_key := param.name.replace("-", "_")) in user_params
+    ]
+
     # Validate individual parameter values
-    for param in server_config.parameters:
-        # Convert parameter name to underscore format to match user_params
-        param_key = param.name.replace("-", "_")
-        if param_key in user_params:
-            value = user_params[param_key]
-            param_errors = validate_parameter_value(param, value)
-            if param_errors:
-                errors.extend(param_errors)
+    for param, _, value in provided:
+        param_errors = validate_parameter_value(param, value)
+        if param_errors:
+            errors.extend(param_errors)
 
     if errors:
         raise ValueError(f"Parameter validation failed: {', '.join(errors)}")
@@ -542,17 +586,12 @@ def generate_client_config(
 
     # Normalize path parameters (convert back to underscore format for generate_args)
     normalized_params = {}
-    for param in server_config.parameters:
-        param_key = param.name.replace("-", "_")
-        if param_key in user_params:
-            value = user_params[param_key]
-            if param.param_type == "path" and value is not None:
-                # Normalize path relative to project directory
-                normalized_params[param_key] = normalize_path_parameter(
-                    value, project_dir
-                )
-            else:
-                normalized_params[param_key] = value
+    for param, param_key, value in provided:
+        if param.param_type == "path" and value is not None:
+            # Normalize path relative to project directory
+            normalized_params[param_key] = normalize_path_parameter(value, project_dir)
+        else:
+            normalized_params[param_key] = value
 
     # Use provided Python executable or default to current
     if python_executable is None:
@@ -596,13 +635,7 @@ def generate_client_config(
     # This ensures the virtual environment and dependencies are accessible
     # We need to capture venv_path BEFORE it might be stripped out by server config
     original_venv_path = normalized_params.get("venv_path")
-    mcp_config_dir = _detect_mcp_config_directory(original_venv_path)
-
-    pythonpath = str(mcp_config_dir)
-    # Ensure trailing separator on Windows
-    if sys.platform == "win32" and not pythonpath.endswith("\\"):
-        pythonpath += "\\"
-    env["PYTHONPATH"] = pythonpath
+    env["PYTHONPATH"] = _get_pythonpath(original_venv_path)
 
     # Venv Python is already handled above in effective_python calculation
 
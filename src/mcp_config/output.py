@@ -15,6 +15,35 @@ class OutputFormatter:
     WARNING = "⚠"
     INFO = "•"
 
+    # Precomputed display strings, built once at class creation
+    _MODE_DISPLAY = {
+        "cli_command": f"{SUCCESS} CLI Command",
+        "python_module": f"{WARNING} Python Module",
+        "development": f"{INFO} Development Mode",
+        "not_installed": f"{ERROR} Not Installed",
+    }
+    _STATUS_SYMBOLS = {
+        "success": SUCCESS,
+        "error": ERROR,
+        "warning": WARNING,
+        "info": INFO,
+    }
+    _CLIENT_DISPLAY_NAMES = {
+        "vscode-workspace": "VSCode (Workspace)",
+        "vscode-user": "VSCode (User Profile)",
+        "claude-desktop": "Claude Desktop",
+    }
+    _DRY_RUN_HEADER = "\nDRY RUN: No changes will be applied"
+
+    @staticmethod
+    def _print_lines(lines: list[str]) -> None:
+        """Print several lines with a single call instead of one print per line.
+
+        Args:
+            lines: Lines to print, without trailing newlines
+        """
+        print("\n".join(lines))
+
     @staticmethod
     def print_success(message: str) -> None:
         """Print success message with checkmark."""
@@ -45,9 +74,9 @@ class OutputFormatter:
         if not errors:
             return
 
-        print("\nValidation Errors:")
-        for error in errors:
-            print(f"  {OutputFormatter.ERROR} {error}")
+        lines = ["\nValidation Errors:"]
+        lines.extend(f"  {OutputFormatter.ERROR} {error}" for error in errors)
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_setup_summary(
@@ -60,18 +89,22 @@ class OutputFormatter:
             server_type: Type of server being configured
             params: Parameters for the server configuration
         """
-        print("\nSetup Summary:")
-        print(f"  Server Name: {server_name}")
-        print(f"  Server Type: {server_type}")
+        lines = [
+            "\nSetup Summary:",
+            f"  Server Name: {server_name}",
+            f"  Server Type: {server_type}",
+        ]
 
         if params:
-            print("  Parameters:")
+            lines.append("  Parameters:")
             for key, value in params.items():
                 if value is not None:
                     display_key = key.replace("_", "-")
                     if isinstance(value, Path):
                         value = str(value)
-                    print(f"    {display_key}: {value}")
+                    lines.append(f"    {display_key}: {value}")
+
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_server_list(
@@ -87,24 +120,26 @@ class OutputFormatter:
             print("No servers configured")
             return
 
-        print("\nConfigured MCP Servers:")
+        lines = ["\nConfigured MCP Servers:"]
         for server in servers:
             managed = server.get("managed", False)
             server_type = server.get("type", "external")
             marker = OutputFormatter.INFO
 
             if managed:
-                print(f"  {marker} {server['name']} ({server_type})")
+                lines.append(f"  {marker} {server['name']} ({server_type})")
             else:
-                print(f"  {marker} {server['name']} (external)")
+                lines.append(f"  {marker} {server['name']} (external)")
 
             if detailed and "command" in server:
-                print(f"      Command: {server['command']}")
+                lines.append(f"      Command: {server['command']}")
                 if server.get("args"):
                     args_str = " ".join(server["args"])
                     if len(args_str) > 60:
                         args_str = args_str[:57] + "..."
-                    print(f"      Args: {args_str}")
+                    lines.append(f"      Args: {args_str}")
+
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_auto_detected_params(params: dict[str, Any]) -> None:
@@ -116,11 +151,13 @@ class OutputFormatter:
         if not params:
             return
 
-        print("\nAuto-detected parameters:")
+        lines = ["\nAuto-detected parameters:"]
         for key, value in params.items():
             if value is not None:
                 display_key = key.replace("_", "-").title().replace("-", " ")
-                print(f"  {OutputFormatter.INFO} {display_key}: {value}")
+                lines.append(f"  {OutputFormatter.INFO} {display_key}: {value}")
+
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_validation_results(validation_result: dict[str, Any]) -> None:
@@ -129,44 +166,31 @@ class OutputFormatter:
         Args:
             validation_result: Dictionary with validation results
         """
+        lines: list[str] = []
+
         # Show installation mode if available
         if "installation_mode" in validation_result:
             mode = validation_result["installation_mode"]
-            mode_display = {
-                "cli_command": f"{OutputFormatter.SUCCESS} CLI Command",
-                "python_module": f"{OutputFormatter.WARNING} Python Module",
-                "development": f"{OutputFormatter.INFO} Development Mode",
-                "not_installed": f"{OutputFormatter.ERROR} Not Installed",
-            }.get(mode, mode)
-            print(f"\nInstallation Mode: {mode_display}")
+            mode_display = OutputFormatter._MODE_DISPLAY.get(mode, mode)
+            lines.append(f"\nInstallation Mode: {mode_display}")
 
         # Print each check with appropriate symbol
         for check in validation_result.get("checks", []):
             status = check.get("status", "unknown")
             message = check.get("message", "")
+            symbol = OutputFormatter._STATUS_SYMBOLS.get(status, OutputFormatter.INFO)
 
-            if status == "success":
-                symbol = OutputFormatter.SUCCESS
-            elif status == "error":
-                symbol = OutputFormatter.ERROR
-            elif status == "warning":
-                symbol = OutputFormatter.WARNING
-            elif status == "info":
-                symbol = OutputFormatter.INFO
-            else:
-                symbol = OutputFormatter.INFO
-
-            print(f"  {symbol} {message}")
+            lines.append(f"  {symbol} {message}")
 
         # Print overall status
-        print()
+        lines.append("")
         if validation_result.get("success"):
             if validation_result.get("warnings"):
-                print("Status: Working with warnings")
+                lines.append("Status: Working with warnings")
             else:
-                print("Status: Working")
+                lines.append("Status: Working")
         else:
-            print("Status: Configuration has errors")
+            lines.append("Status: Configuration has errors")
 
         # Show installation instructions if needed
         if "installation_mode" in validation_result:
@@ -180,7 +204,9 @@ class OutputFormatter:
                     and instructions
                     != "Please check the documentation for installation instructions."
                 ):
-                    print(f"\n{instructions}")
+                    lines.append(f"\n{instructions}")
+
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_configuration_details(
@@ -197,8 +223,7 @@ class OutputFormatter:
             params: Configuration parameters
             _tree_format: Deprecated, ignored (kept for compatibility)
         """
-        print(f"\nConfiguration for '{server_name}':")
-        print(f"  Type: {server_type}")
+        lines = [f"\nConfiguration for '{server_name}':", f"  Type: {server_type}"]
 
         if params:
             for key, value in params.items():
@@ -206,12 +231,14 @@ class OutputFormatter:
                     display_key = key.replace("_", "-")
                     if isinstance(value, Path):
                         value = str(value)
-                    print(f"  {display_key}: {value}")
+                    lines.append(f"  {display_key}: {value}")
+
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_dry_run_header() -> None:
         """Print dry-run mode header."""
-        print("\nDRY RUN: No changes will be applied")
+        print(OutputFormatter._DRY_RUN_HEADER)
 
     @staticmethod
     def print_dry_run_config_preview(
@@ -283,19 +310,22 @@ class OutputFormatter:
             config_path: Path to configuration file
             backup_path: Path where backup would be created
         """
-        print(f"\nWould remove server '{server_name}'")
-        print(f"  Type: {server_info.get('type', 'unknown')}")
+        lines = [
+            f"\nWould remove server '{server_name}'",
+            f"  Type: {server_info.get('type', 'unknown')}",
+        ]
 
         if other_servers:
-            print(f"  Preserving {len(other_servers)} other server(s)")
+            lines.append(f"  Preserving {len(other_servers)} other server(s)")
 
-        print(f"  File: {config_path}")
+        lines.append(f"  File: {config_path}")
         if backup_path:
-            print(f"  Backup: {backup_path}")
+            lines.append(f"  Backup: {backup_path}")
 
-        print(
+        lines.append(
             f"\n{OutputFormatter.SUCCESS} Removal safe. Run without --dry-run to apply."
         )
+        OutputFormatter._print_lines(lines)
 
     @staticmethod
     def print_enhanced_server_list(
@@ -313,18 +343,14 @@ class OutputFormatter:
             detailed: Whether to show detailed information
         """
         # Get display name for client
-        display_name = client_name
-        if client_name == "vscode-workspace":
-            display_name = "VSCode (Workspace)"
-        elif client_name == "vscode-user":
-            display_name = "VSCode (User Profile)"
-        elif client_name == "claude-desktop":
-            display_name = "Claude Desktop"
+        display_name = OutputFormatter._CLIENT_DISPLAY_NAMES.get(
+            client_name, client_name
+        )
 
-        print(f"\nMCP Servers for {display_name}:")
+        lines = [f"\nMCP Servers for {display_name}:"]
 
         if not servers:
-            print("  No servers configured")
+            lines.append("  No servers configured")
         else:
             for server in servers:
                 managed = server.get("managed", False)
@@ -334,12 +360,13 @@ class OutputFormatter:
                 marker = OutputFormatter.INFO
 
                 if managed:
-                    print(f"  {marker} {server['name']} ({server_type})")
+                    lines.append(f"  {marker} {server['name']} ({server_type})")
                 else:
-                    print(f"  {marker} {server['name']} (external)")
+                    lines.append(f"  {marker} {server['name']} (external)")
 
                 if detailed and "command" in server:
-                    print(f"      Command: {server['command']}")
+                    lines.append(f"      Command: {server['command']}")
 
-        print(f"\nConfiguration file: {config_path}")
-        print("\nUse 'mcp-config validate <server-name>' to check a server")
+        lines.append(f"\nConfiguration file: {config_path}")
+        lines.append("\nUse 'mcp-config validate <server-name>' to check a server")
+        OutputFormatter._print_lines(lines)
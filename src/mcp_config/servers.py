@@ -4,22 +4,34 @@ This module provides the data structures needed to represent, validate,
 and generate command-line arguments for MCP servers.
 """
 
+import bisect
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
 
+_VALID_PARAM_TYPES = frozenset({"string", "boolean", "choice", "path"})
 
-@dataclass
+# Parameters a server's CLI command does not accept, keyed by server name
+_CLI_UNSUPPORTED_PARAMS: dict[str, frozenset[str]] = {
+    "mcp-server-filesystem": frozenset({"venv-path", "python-executable"}),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ParameterDef:
     """Definition of a server parameter for CLI and config generation.
 
+    Instances are immutable and hashable, so they can be used as cache keys.
+
     Attributes:
         name: CLI parameter name (e.g., "project-dir")
         arg_name: Server argument (e.g., "--project-dir")
         param_type: Type of parameter ("string", "boolean", "choice", "path")
         required: Whether the parameter is required
         default: Default value for the parameter
-        choices: List of valid choices for "choice" type parameters
+        choices: Valid choices for "choice" type parameters (stored as a tuple)
         help: Help text for CLI
         is_flag: True for boolean flags (action="store_true")
         auto_detect: True if value can be auto-detected
@@ -31,22 +43,23 @@ class ParameterDef:
     arg_name: str
     param_type: str
     required: bool = False
-    default: Any = None
-    choices: list[str] | None = None
+    # Excluded from the hash so mutable defaults (e.g. lists) stay hashable
+    default: Any = field(default=None, hash=False)
+    choices: Sequence[str] | None = None
     help: str = ""
     is_flag: bool = False
     auto_detect: bool = False
     validator: Callable[[Any, str], list[str]] | None = None
     repeatable: bool = False
+    _underscore_name: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate parameter definition after creation."""
         # Validate parameter type
-        valid_types = {"string", "boolean", "choice", "path"}
-        if self.param_type not in valid_types:
+        if self.param_type not in _VALID_PARAM_TYPES:
             raise ValueError(
                 f"Invalid param_type '{self.param_type}'. "
-                f"Must be one of: {', '.join(sorted(valid_types))}"
+                f"Must be one of: {', '.join(sorted(_VALID_PARAM_TYPES))}"
             )
 
         # Validate name and arg_name
@@ -57,7 +70,7 @@ class ParameterDef:
 
         # Validate choice parameters
         if self.param_type == "choice":
-            if self.choices is None or not isinstance(self.choices, list):
+            if self.choices is None or not isinstance(self.choices, (list, tuple)):
                 raise ValueError(
                     f"Parameter '{self.name}' of type 'choice' must have a non-empty choices list"
                 )
@@ -77,8 +90,20 @@ class ParameterDef:
                     f"Boolean flag parameter '{self.name}' must have a boolean default value"
                 )
 
+        if isinstance(self.choices, (list, tuple)):
+            # Store choices as a tuple so the frozen instance stays hashable
+            object.__setattr__(self, "choices", tuple(self.choices))
+        # Names and types are compared on every lookup; share one copy of each
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "arg_name", sys.intern(self.arg_name))
+        object.__setattr__(self, "param_type", sys.intern(self.param_type))
+        # Key used for this parameter in user_params dictionaries
+        object.__setattr__(
+            self, "_underscore_name", sys.intern(self.name.replace("-", "_"))
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Complete configuration for an MCP server type.
 
@@ -86,13 +111,23 @@ class ServerConfig:
         name: Internal name of the server (e.g., "mcp-code-checker")
         display_name: Human-readable display name
         main_module: Path to the main module to execute
-        parameters: List of all possible parameters for this server
+        parameters: All possible parameters for this server (the built-in
+            servers use tuples so their definitions cannot be mutated)
+        required_paths: Paths, relative to the project directory, that must
+            exist for a development-mode project to be valid (defaults to
+            main_module)
     """
 
     name: str
     display_name: str
     main_module: str
-    parameters: list[ParameterDef] = field(default_factory=list)
+    parameters: Sequence[ParameterDef] = field(default_factory=list)
+    required_paths: tuple[Path, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Default the required development-mode paths to the main module."""
+        if not self.required_paths:
+            self.required_paths = (Path(self.main_module),)
 
     def _add_parameter_args(
         self, args: list[str], param: ParameterDef, value: Any
@@ -104,13 +139,16 @@ class ServerConfig:
             param: Parameter definition
             value: Parameter value (single value or list for repeatable params)
         """
+        arg_name = param.arg_name
         if param.repeatable and isinstance(value, list):
             # Handle list values for repeatable parameters
             for item in value:
-                args.extend([param.arg_name, str(item)])
+                args.append(arg_name)
+                args.append(str(item))
         else:
             # Handle single values (both repeatable and non-repeatable)
-            args.extend([param.arg_name, str(value)])
+            args.append(arg_name)
+            args.append(str(value))
 
     def generate_args(
         self, user_params: dict[str, Any], use_cli_command: bool = False
@@ -124,12 +162,6 @@ class ServerConfig:
         Returns:
             List of command-line arguments
         """
-        from .validation import (
-            auto_detect_python_executable,
-            auto_detect_venv_path,
-            normalize_path,
-        )
-
         # For CLI command mode, don't include the main module
         if use_cli_command:
             args = []
@@ -151,25 +183,28 @@ class ServerConfig:
         if "project_dir" in processed_params:
             project_dir = Path(processed_params["project_dir"])
 
-        for param in self.parameters:
-            param_key = param.name.replace("-", "_")
+        if project_dir:
+            for param in self.parameters:
+                if not param.auto_detect:
+                    continue
 
-            # Skip if already has a value
-            if (
-                param_key in processed_params
-                and processed_params[param_key] is not None
-            ):
-                continue
+                param_key = param._underscore_name
+
+                # Skip if already has a value
+                if processed_params.get(param_key) is not None:
+                    continue
 
-            # Auto-detect if possible
-            if param.auto_detect and project_dir:
                 if param.name == "python-executable":
                     # Don't auto-detect python-executable in CLI command mode
                     if not use_cli_command:
+                        from .validation import auto_detect_python_executable
+
                         detected = auto_detect_python_executable(project_dir)
                         if detected:
                             processed_params[param_key] = str(detected)
                 elif param.name == "venv-path":
+                    from .validation import auto_detect_venv_path
+
                     detected = auto_detect_venv_path(project_dir)
                     if detected:
                         processed_params[param_key] = str(detected)
@@ -178,33 +213,24 @@ class ServerConfig:
                     # Only include if explicitly provided by user
                     pass
 
+        # Parameters to skip in CLI command mode
+        # (e.g. the filesystem server doesn't support venv-path/python-executable)
+        unsupported: frozenset[str] = (
+            _CLI_UNSUPPORTED_PARAMS.get(self.name, frozenset())
+            if use_cli_command
+            else frozenset()
+        )
+
         # Generate arguments
         for param in self.parameters:
-            param_key = param.name.replace("-", "_")
-
             # Get value from processed params or use default
-            value = processed_params.get(param_key, param.default)
+            value = processed_params.get(param._underscore_name, param.default)
 
             # Skip if no value provided or empty list
             if value is None or (isinstance(value, list) and len(value) == 0):
                 continue
 
-            # Skip venv-path for mcp-server-filesystem in CLI command mode
-            # The filesystem server doesn't support this parameter
-            if (
-                self.name == "mcp-server-filesystem"
-                and param.name == "venv-path"
-                and use_cli_command
-            ):
-                continue
-
-            # Skip python-executable for mcp-server-filesystem in CLI command mode
-            # The filesystem server doesn't support this parameter
-            if (
-                self.name == "mcp-server-filesystem"
-                and param.name == "python-executable"
-                and use_cli_command
-            ):
+            if param.name in unsupported:
                 continue
 
             # Always include python-executable parameter for reliable execution
@@ -217,6 +243,8 @@ class ServerConfig:
             else:
                 # Normalize paths (updated logic for lists using explicit for-loop)
                 if param.param_type == "path" and project_dir:
+                    from .validation import normalize_path
+
                     if isinstance(value, list):
                         # Explicit for-loop approach for list normalization
                         for i, v in enumerate(value):
@@ -344,7 +372,7 @@ class ServerConfig:
         if self.name == "mcp-code-checker":
             # If using CLI command, just verify directory exists
             if self.supports_cli_command():
-                return project_dir.exists() and project_dir.is_dir()
+                return project_dir.is_dir()
 
             # Check if package is installed (module mode)
             try:
@@ -353,19 +381,15 @@ class ServerConfig:
                 spec = importlib.util.find_spec("mcp_code_checker")
                 if spec is not None:
                     # Package is installed, just need valid directory
-                    return project_dir.exists() and project_dir.is_dir()
+                    return project_dir.is_dir()
             except (ImportError, ModuleNotFoundError):
                 pass
 
-            # Development mode - check for expected structure
-            main_path = project_dir / self.main_module
-            src_path = project_dir / "src"
-
-            # Both the main module and src directory should exist
-            return main_path.exists() and src_path.exists()
+            # Development mode - all expected paths should exist
+            return all((project_dir / path).exists() for path in self.required_paths)
         elif self.name == "mcp-server-filesystem":
             # Enhanced validation for filesystem server
-            if not (project_dir.exists() and project_dir.is_dir()):
+            if not project_dir.is_dir():
                 return False
 
             # If using CLI command, just verify directory exists and is accessible
@@ -433,6 +457,10 @@ class ServerRegistry:
     def __init__(self) -> None:
         """Initialize the server registry."""
         self._servers: dict[str, ServerConfig] = {}
+        # Live read-only view returned by get_all_configs
+        self._view = MappingProxyType(self._servers)
+        # Kept sorted on registration so list_servers does not sort per call
+        self._sorted_names: list[str] = []
 
     def register(self, config: ServerConfig) -> None:
         """Register a server configuration.
@@ -446,6 +474,7 @@ class ServerRegistry:
         if config.name in self._servers:
             raise ValueError(f"Server '{config.name}' is already registered")
         self._servers[config.name] = config
+        bisect.insort(self._sorted_names, config.name)
 
     def get(self, name: str) -> ServerConfig | None:
         """Get server configuration by name.
@@ -464,15 +493,16 @@ class ServerRegistry:
         Returns:
             Sorted list of server names
         """
-        return sorted(self._servers.keys())
+        return list(self._sorted_names)
 
-    def get_all_configs(self) -> dict[str, ServerConfig]:
+    def get_all_configs(self) -> Mapping[str, ServerConfig]:
         """Get all registered configurations.
 
         Returns:
-            Copy of the internal server configurations dictionary
+            Read-only live view of the server configurations; this is not a
+            copy and reflects servers registered later
         """
-        return self._servers.copy()
+        return self._view
 
     def is_registered(self, name: str) -> bool:
         """Check if a server is registered.
@@ -494,7 +524,7 @@ MCP_CODE_CHECKER = ServerConfig(
     name="mcp-code-checker",
     display_name="MCP Code Checker",
     main_module="src/main.py",
-    parameters=[
+    parameters=(
         # Required parameters
         ParameterDef(
             name="project-dir",
@@ -553,7 +583,7 @@ MCP_CODE_CHECKER = ServerConfig(
             help="Path for structured JSON logs. "
             "Auto-generates timestamped log file in project_dir/logs/ if not specified",
         ),
-    ],
+    ),
 )
 
 # MCP Filesystem Server built-in config
@@ -561,7 +591,7 @@ MCP_FILESYSTEM_SERVER = ServerConfig(
     name="mcp-server-filesystem",
     display_name="MCP Filesystem Server",
     main_module="src/mcp_server_filesystem/main.py",
-    parameters=[
+    parameters=(
         # Required parameters
         ParameterDef(
             name="project-dir",
@@ -614,7 +644,7 @@ MCP_FILESYSTEM_SERVER = ServerConfig(
             "Can be specified multiple times to add multiple reference projects. "
             "Example: --reference-project docs=/path/to/docs",
         ),
-    ],
+    ),
 )
 
 # Register the built-in servers
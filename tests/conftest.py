@@ -11,7 +11,6 @@ Key isolation strategies:
 """
 
 import shutil
-import tempfile
 from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import patch
@@ -77,8 +76,24 @@ def global_test_isolation() -> Generator[None, None, None]:
                 pass
 
 
+@pytest.fixture(autouse=True)
+def clear_cli_executable_cache() -> Generator[None, None, None]:
+    """Clear the cached CLI executable lookups around each test.
+
+    _find_cli_executable is memoized, so without this a lookup made under
+    one test's patched PATH or venv would leak into the next test.
+    """
+    from src.mcp_config.integration import _find_cli_executable
+
+    _find_cli_executable.cache_clear()
+    yield
+    _find_cli_executable.cache_clear()
+
+
 @pytest.fixture(scope="function")
-def isolated_temp_dir() -> Generator[Path, None, None]:
+def isolated_temp_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
     """Provide completely isolated temporary directory for each test.
 
     This fixture ensures:
@@ -87,37 +102,21 @@ def isolated_temp_dir() -> Generator[Path, None, None]:
     - All files and directories are cleaned up after the test
     - Even if test fails, cleanup still happens
 
+    Directories are created below pytest's session-wide base temp directory,
+    so no separate mkdtemp is needed per test.
+
     Usage:
         def test_something(isolated_temp_dir: Path):
             config_file = isolated_temp_dir / "config.json"
             # ... test code ...
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        temp_path = Path(tmpdir)
-
-        # Ensure directory is completely clean
-        for item in temp_path.iterdir():
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                shutil.rmtree(item, ignore_errors=True)
+    # mktemp(numbered=True) always returns a new, empty directory
+    temp_path = tmp_path_factory.mktemp("isolated")
 
-        yield temp_path
+    yield temp_path
 
-        # Explicit cleanup after test
-        if temp_path.exists():
-            try:
-                shutil.rmtree(temp_path, ignore_errors=True)
-            except Exception:
-                # If cleanup fails, at least try to remove individual files
-                for item in temp_path.iterdir():
-                    try:
-                        if item.is_file():
-                            item.unlink()
-                        elif item.is_dir():
-                            shutil.rmtree(item, ignore_errors=True)
-                    except Exception:
-                        pass
+    # Explicit cleanup after test
+    shutil.rmtree(temp_path, ignore_errors=True)
 
 
 @pytest.fixture(scope="function")
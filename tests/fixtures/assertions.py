@@ -0,0 +1,11 @@
+"""Shared assertion helpers for tests."""
+
+
+def assert_all_in(text: str, *expected: str) -> None:
+    """Assert that every expected substring occurs in text.
+
+    All substrings are checked in one pass, so a failure reports every
+    missing one instead of only the first.
+    """
+    missing = [item for item in expected if item not in text]
+    assert not missing, f"Missing from text: {missing}\n{text!r}"
@@ -0,0 +1,56 @@
+"""Fake mcp-config installation layout for testing.
+
+This module builds a minimal mcp-config directory containing a virtual
+environment with the executables the configuration generator looks for.
+"""
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class FakeVenvLayout:
+    """Paths of a fake mcp-config installation with a virtual environment."""
+
+    mcp_config_dir: Path
+    venv_path: Path
+    python_exe: Path
+    checker_exe: Path
+    filesystem_exe: Path
+
+
+def create_fake_venv(root: Path) -> FakeVenvLayout:
+    """Create a fake mcp-config directory with a .venv below root.
+
+    Args:
+        root: Existing directory to create the layout in
+
+    Returns:
+        FakeVenvLayout describing the created paths
+    """
+    mcp_config_dir = root / "mcp-config"
+    venv_path = mcp_config_dir / ".venv"
+
+    if sys.platform == "win32":
+        scripts_dir = venv_path / "Scripts"
+        suffix = ".exe"
+    else:
+        scripts_dir = venv_path / "bin"
+        suffix = ""
+    scripts_dir.mkdir(parents=True)
+
+    layout = FakeVenvLayout(
+        mcp_config_dir=mcp_config_dir,
+        venv_path=venv_path,
+        python_exe=scripts_dir / f"python{suffix}",
+        checker_exe=scripts_dir / f"mcp-code-checker{suffix}",
+        filesystem_exe=scripts_dir / f"mcp-server-filesystem{suffix}",
+    )
+    for exe in (layout.python_exe, layout.checker_exe, layout.filesystem_exe):
+        exe.touch()
+        # Make executables actually executable on Unix
+        if sys.platform != "win32":
+            exe.chmod(0o755)
+
+    return layout
@@ -0,0 +1,51 @@
+"""Shared fixtures for configuration tests."""
+
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures.fake_venv import FakeVenvLayout, create_fake_venv
+
+
+@pytest.fixture(scope="session")
+def fake_venv_layout(tmp_path_factory: pytest.TempPathFactory) -> FakeVenvLayout:
+    """Provide a fake mcp-config directory with a .venv, built once per session.
+
+    Tests must treat the layout as read-only; use tmp_path for per-test
+    project directories.
+    """
+    return create_fake_venv(tmp_path_factory.mktemp("venv"))
+
+
+@pytest.fixture
+def patched_find_cli(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Replace _find_cli_executable with a lookup in a per-test dict.
+
+    Tests register CLI commands by name, e.g.
+    ``patched_find_cli["mcp-code-checker"] = "/venv/bin/mcp-code-checker"``;
+    unregistered commands are reported as not found.
+    """
+    executables: dict[str, str] = {}
+
+    def fake_find_cli_executable(
+        command_name: str, venv_path: str | None = None
+    ) -> str | None:
+        return executables.get(command_name)
+
+    monkeypatch.setattr(
+        "src.mcp_config.integration._find_cli_executable", fake_find_cli_executable
+    )
+    return executables
+
+
+@pytest.fixture(scope="session")
+def valid_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a project directory with the src/main.py development layout.
+
+    Built once per session; tests must not modify it.
+    """
+    project_dir = tmp_path_factory.mktemp("project")
+    src_dir = project_dir / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("# Main module")
+    return project_dir
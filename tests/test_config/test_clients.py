@@ -437,6 +437,21 @@ class TestClaudeDesktopHandler(BaseClaudeDesktopTest):
         assert len(errors) > 0
         assert any("env" in e and "object" in e for e in errors)
 
+    def test_save_metadata_atomic_write(self, handler: ClaudeDesktopHandler) -> None:
+        """Test that metadata is written atomically without leftover temp files."""
+        from src.mcp_config.clients.utils import load_metadata, save_metadata
+
+        config_path = handler.get_config_path()
+        metadata = {"my-server": {"_managed_by": "mcp-config-managed"}}
+
+        save_metadata(config_path, metadata)
+
+        # Verify no .tmp file remains
+        temp_files = list(config_path.parent.glob("*.tmp"))
+        assert len(temp_files) == 0
+
+        assert load_metadata(config_path) == metadata
+
 
 class TestClientRegistry:
     """Test client registry functionality."""
@@ -2,13 +2,8 @@
 
 from unittest.mock import patch
 
-from mcp_config.integration import (  # type: ignore[import-untyped]
-    generate_client_config,
-)
-from mcp_config.servers import (  # type: ignore[import-untyped]
-    MCP_CODE_CHECKER,
-    MCP_FILESYSTEM_SERVER,
-)
+from src.mcp_config.integration import generate_client_config
+from src.mcp_config.servers import MCP_CODE_CHECKER, MCP_FILESYSTEM_SERVER
 
 
 def test_filesystem_server_no_venv_path() -> None:
@@ -10,6 +10,10 @@ import pytest
 
 from src.mcp_config.clients import ClaudeDesktopHandler
 from src.mcp_config.integration import (
+    _DEFAULT_PYTHONPATH,
+    _MCP_CONFIG_DIR,
+    _find_cli_executable,
+    _get_pythonpath,
     generate_client_config,
     remove_mcp_server,
     setup_mcp_server,
@@ -141,13 +145,14 @@ class TestGenerateClientConfig:
         python_exe.touch()
 
         # Add venv parameter to server config
-        server_config.parameters.append(
+        server_config.parameters = [
+            *server_config.parameters,
             ParameterDef(
                 name="venv-path",
                 arg_name="--venv-path",
                 param_type="path",
-            )
-        )
+            ),
+        ]
 
         user_params = {
             "project_dir": str(tmp_path),
@@ -571,6 +576,47 @@ class TestMCPFilesystemServerIntegration:
                 assert "-m" in config["args"]
                 assert "mcp_server_filesystem" in config["args"]
 
+    def test_find_cli_executable_is_cached(self) -> None:
+        """Test that repeated CLI lookups hit the cache until it is cleared."""
+        with patch(
+            "src.mcp_config.integration.shutil.which",
+            return_value="/usr/bin/mcp-server-filesystem",
+        ) as mock_which:
+            first = _find_cli_executable("mcp-server-filesystem")
+            second = _find_cli_executable("mcp-server-filesystem")
+            assert first == second
+            assert mock_which.call_count == 1
+
+            _find_cli_executable.cache_clear()
+            _find_cli_executable("mcp-server-filesystem")
+            assert mock_which.call_count == 2
+
+    def test_get_pythonpath_default_matches_equal_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an equal, separately built mcp-config path gives the default."""
+        equal_dir = Path(str(_MCP_CONFIG_DIR))
+        assert equal_dir is not _MCP_CONFIG_DIR
+        monkeypatch.setattr(
+            "src.mcp_config.integration._detect_mcp_config_directory",
+            lambda venv_path=None: equal_dir,
+        )
+
+        assert _get_pythonpath() == _DEFAULT_PYTHONPATH
+
+    def test_get_pythonpath_other_directory(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a different mcp-config directory is not given the default."""
+        monkeypatch.setattr(
+            "src.mcp_config.integration._detect_mcp_config_directory",
+            lambda venv_path=None: tmp_path,
+        )
+
+        pythonpath = _get_pythonpath()
+        assert pythonpath != _DEFAULT_PYTHONPATH
+        assert pythonpath.startswith(str(tmp_path))
+
     @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific path test")
     def test_mcp_filesystem_server_realistic_windows_config(
         self, tmp_path: Path
@@ -1,13 +1,17 @@
 """Tests for the main CLI module."""
 
+import argparse
 import sys
 from argparse import Namespace
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, Callable
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.mcp_config import cli_utils as cli_utils_module
+from src.mcp_config import main as main_module
 from src.mcp_config.cli_utils import (
     add_list_subcommand,
     add_parameter_to_parser,
@@ -15,6 +19,7 @@ from src.mcp_config.cli_utils import (
     add_server_parameters,
     add_setup_subcommand,
 )
+from src.mcp_config.clients import ClientHandler
 from src.mcp_config.main import (
     create_main_parser,
     extract_user_parameters,
@@ -26,6 +31,127 @@ from src.mcp_config.main import (
 from src.mcp_config.output import OutputFormatter
 from src.mcp_config.servers import ParameterDef, ServerConfig
 
+# Shared path constants; Path objects are immutable so tests can reuse them
+TEST_DIR = Path("/test")
+CONFIG_PATH = Path("/config.json")
+PYTHON_EXE = Path("/usr/bin/python")
+VENV_PATH = Path("/venv")
+
+
+def _mock_client(**return_values: Any) -> MagicMock:
+    """Create a ClientHandler mock whose methods return the given values.
+
+    spec_set restricts the mock to the real ClientHandler interface, so a
+    typo or a call to a method handlers do not provide fails the test.
+    """
+    client = MagicMock(spec_set=ClientHandler)
+    for method, value in return_values.items():
+        getattr(client, method).return_value = value
+    return client
+
+
+@pytest.fixture(scope="module")
+def main_parser() -> argparse.ArgumentParser:
+    """Build the main CLI parser once for all parsing tests in this module."""
+    return create_main_parser()
+
+
+@pytest.fixture(scope="module")
+def sample_server_config() -> ServerConfig:
+    """Build one read-only server config shared by the parameter tests."""
+    return ServerConfig(
+        name="test-server",
+        display_name="Test Server",
+        main_module="test",
+        parameters=[
+            ParameterDef(
+                name="project-dir",
+                arg_name="--project-dir",
+                param_type="path",
+                required=True,
+                help="Project directory",
+            ),
+            ParameterDef(
+                name="debug",
+                arg_name="--debug",
+                param_type="boolean",
+                is_flag=True,
+                help="Enable debug mode",
+            ),
+            ParameterDef(
+                name="log-level",
+                arg_name="--log-level",
+                param_type="choice",
+                choices=["DEBUG", "INFO", "WARNING"],
+                default="INFO",
+                help="Log level",
+            ),
+            ParameterDef(
+                name="workers",
+                arg_name="--workers",
+                param_type="string",
+                default="4",
+                help="Number of workers",
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def setup_command_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the collaborators of handle_setup_command with ready-made mocks.
+
+    The mocks describe a valid setup: a known server type, a detected Python
+    environment and no validation errors. Tests adjust individual return
+    values as needed.
+    """
+    server_config = ServerConfig(
+        name="test-server", display_name="Test Server", main_module="test"
+    )
+    mock_client = _mock_client(get_config_path=CONFIG_PATH)
+
+    mocks = SimpleNamespace(
+        registry=MagicMock(),
+        get_client_handler=MagicMock(return_value=mock_client),
+        detect_python_environment=MagicMock(return_value=(PYTHON_EXE, VENV_PATH)),
+        validate_setup_args=MagicMock(return_value=[]),
+        validate_parameter_combination=MagicMock(return_value=[]),
+        validate_required_parameters=MagicMock(return_value=[]),
+        setup_mcp_server=MagicMock(
+            return_value={"success": True, "backup_path": "/backup"}
+        ),
+        build_server_config=MagicMock(
+            return_value={
+                "command": "/usr/bin/python",
+                "args": ["--project-dir", "/test"],
+                "_managed_by": "mcp-config-managed",
+                "_server_type": "test-server",
+            }
+        ),
+    )
+    mocks.registry.get.return_value = server_config
+
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(main_module, name, mock)
+
+    return mocks
+
+
+@pytest.fixture
+def make_args() -> Callable[..., Namespace]:
+    """Build command Namespaces from common defaults plus per-test overrides."""
+    defaults: dict[str, Any] = {
+        "client": "claude-desktop",
+        "dry_run": False,
+        "verbose": False,
+        "backup": True,
+    }
+
+    def _make(**overrides: Any) -> Namespace:
+        return Namespace(**{**defaults, **overrides})
+
+    return _make
+
 
 class TestMainParserCreation:
     """Test parser creation and configuration."""
@@ -37,166 +163,124 @@ class TestMainParserCreation:
         description = parser.description or ""
         assert "MCP Configuration Helper" in description
 
-    def test_subcommands_added(self) -> None:
+    def test_subcommands_added(self, main_parser: argparse.ArgumentParser) -> None:
         """Test that all subcommands are added."""
-        parser = create_main_parser()
-        # Parse with --help to check subcommands exist
-        with pytest.raises(SystemExit):
-            parser.parse_args(["--help"])
-
-    def test_setup_command_parsing(self) -> None:
-        """Test setup command argument parsing."""
-        parser = create_main_parser()
-        args = parser.parse_args(
-            ["setup", "mcp-code-checker", "test-server", "--project-dir", "."]
-        )
-        assert args.command == "setup"
-        assert args.server_type == "mcp-code-checker"
-        assert args.server_name == "test-server"
-        assert args.project_dir == Path(".")
-
-    def test_remove_command_parsing(self) -> None:
-        """Test remove command argument parsing."""
-        parser = create_main_parser()
-        args = parser.parse_args(["remove", "test-server"])
-        assert args.command == "remove"
-        assert args.server_name == "test-server"
-
-    def test_list_command_parsing(self) -> None:
-        """Test list command argument parsing."""
-        parser = create_main_parser()
-        args = parser.parse_args(["list"])
-        assert args.command == "list"
-
-    def test_list_command_with_options(self) -> None:
-        """Test list command with optional arguments."""
-        parser = create_main_parser()
-        args = parser.parse_args(["list", "--detailed", "--managed-only"])
-        assert args.command == "list"
-        assert args.detailed is True
-        assert args.managed_only is True
-
-    def test_setup_command_with_dry_run(self) -> None:
-        """Test setup command with dry-run option."""
-        parser = create_main_parser()
-        args = parser.parse_args(
-            ["setup", "mcp-code-checker", "test", "--project-dir", ".", "--dry-run"]
-        )
-        assert args.dry_run is True
-
-    def test_invalid_command(self) -> None:
+        # Inspect the subparsers directly instead of rendering --help
+        subparsers = [
+            action
+            for action in main_parser._actions
+            if isinstance(action, argparse._SubParsersAction)
+        ]
+        assert subparsers
+        assert {"setup", "remove", "list"}.issubset(subparsers[0].choices)
+
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            pytest.param(
+                ["setup", "mcp-code-checker", "test-server", "--project-dir", "."],
+                {
+                    "command": "setup",
+                    "server_type": "mcp-code-checker",
+                    "server_name": "test-server",
+                    "project_dir": Path("."),
+                },
+                id="setup",
+            ),
+            pytest.param(
+                ["remove", "test-server"],
+                {"command": "remove", "server_name": "test-server"},
+                id="remove",
+            ),
+            pytest.param(["list"], {"command": "list"}, id="list"),
+            pytest.param(
+                ["list", "--detailed", "--managed-only"],
+                {"command": "list", "detailed": True, "managed_only": True},
+                id="list_with_options",
+            ),
+            pytest.param(
+                [
+                    "setup",
+                    "mcp-code-checker",
+                    "test",
+                    "--project-dir",
+                    ".",
+                    "--dry-run",
+                ],
+                {"dry_run": True},
+                id="setup_with_dry_run",
+            ),
+        ],
+    )
+    def test_command_parsing(
+        self,
+        main_parser: argparse.ArgumentParser,
+        argv: list[str],
+        expected: dict[str, Any],
+    ) -> None:
+        """Test that subcommand arguments are parsed into the expected attributes."""
+        args = main_parser.parse_args(argv)
+        for attr, value in expected.items():
+            actual = getattr(args, attr)
+            if isinstance(value, bool):
+                assert actual is value, attr
+            else:
+                assert actual == value, attr
+
+    def test_invalid_command(self, main_parser: argparse.ArgumentParser) -> None:
         """Test that invalid commands raise error."""
-        parser = create_main_parser()
         with pytest.raises(SystemExit):
-            parser.parse_args(["invalid-command"])
+            main_parser.parse_args(["invalid-command"])
 
 
 class TestServerSpecificOptions:
     """Test server-specific option handling."""
 
-    def test_add_server_parameters(self) -> None:
-        """Test adding server-specific options to parser."""
-        # Create a mock server config
-        mock_config = ServerConfig(
-            name="test-server",
-            display_name="Test Server",
-            main_module="test",
-            parameters=[
-                ParameterDef(
-                    name="project-dir",
-                    arg_name="--project-dir",
-                    param_type="path",
-                    required=True,
-                    help="Project directory",
-                ),
-                ParameterDef(
-                    name="debug",
-                    arg_name="--debug",
-                    param_type="boolean",
-                    is_flag=True,
-                    help="Enable debug mode",
-                ),
-                ParameterDef(
-                    name="log-level",
-                    arg_name="--log-level",
-                    param_type="choice",
-                    choices=["DEBUG", "INFO", "WARNING"],
-                    default="INFO",
-                    help="Log level",
-                ),
-            ],
-        )
+    @pytest.fixture
+    def patched_registry(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace the registry used by cli_utils with a mock."""
+        mock_registry = MagicMock()
+        monkeypatch.setattr(cli_utils_module, "registry", mock_registry)
+        return mock_registry
 
-        # Mock registry
-        with patch("src.mcp_config.cli_utils.registry") as mock_registry:
-            mock_registry.get.return_value = mock_config
-
-            import argparse
+    def test_add_server_parameters(
+        self, patched_registry: MagicMock, sample_server_config: ServerConfig
+    ) -> None:
+        """Test adding server-specific options to parser."""
+        patched_registry.get.return_value = sample_server_config
 
-            parser = argparse.ArgumentParser()
-            add_server_parameters(parser, "test-server")
+        parser = argparse.ArgumentParser()
+        add_server_parameters(parser, "test-server")
 
-            # Test that options were added
-            args = parser.parse_args(
-                ["--project-dir", "/test", "--debug", "--log-level", "DEBUG"]
-            )
-            assert args.project_dir == Path("/test")
-            assert args.debug is True
-            assert args.log_level == "DEBUG"
+        # Test that options were added
+        args = parser.parse_args(
+            ["--project-dir", "/test", "--debug", "--log-level", "DEBUG"]
+        )
+        assert args.project_dir == TEST_DIR
+        assert args.debug is True
+        assert args.log_level == "DEBUG"
 
-    def test_add_server_parameters_no_config(self) -> None:
+    def test_add_server_parameters_no_config(self, patched_registry: MagicMock) -> None:
         """Test handling when server config doesn't exist."""
-        with patch("src.mcp_config.cli_utils.registry") as mock_registry:
-            mock_registry.get.return_value = None
-
-            import argparse
+        patched_registry.get.return_value = None
 
-            parser = argparse.ArgumentParser()
-            # Should not raise error
-            add_server_parameters(parser, "nonexistent")
+        parser = argparse.ArgumentParser()
+        # Should not raise error
+        add_server_parameters(parser, "nonexistent")
 
 
 class TestExtractUserParameters:
     """Test parameter extraction from CLI arguments."""
 
-    def test_extract_user_parameters(self) -> None:
+    def test_extract_user_parameters(self, sample_server_config: ServerConfig) -> None:
         """Test extracting user parameters from args."""
-        mock_config = ServerConfig(
-            name="test-server",
-            display_name="Test Server",
-            main_module="test",
-            parameters=[
-                ParameterDef(
-                    name="project-dir",
-                    arg_name="--project-dir",
-                    param_type="path",
-                    required=True,
-                    help="Project directory",
-                ),
-                ParameterDef(
-                    name="debug",
-                    arg_name="--debug",
-                    param_type="boolean",
-                    is_flag=True,
-                    help="Debug mode",
-                ),
-                ParameterDef(
-                    name="workers",
-                    arg_name="--workers",
-                    param_type="string",
-                    default="4",
-                    help="Number of workers",
-                ),
-            ],
-        )
-
         args = Namespace(
-            project_dir=Path("/test"), debug=True, workers=8, other_attr="ignored"
+            project_dir=TEST_DIR, debug=True, workers=8, other_attr="ignored"
         )
 
-        params = extract_user_parameters(args, mock_config)
+        params = extract_user_parameters(args, sample_server_config)
 
-        assert params["project_dir"] == Path("/test")
+        assert params["project_dir"] == TEST_DIR
         assert params["debug"] is True
         assert params["workers"] == 8
         assert "other_attr" not in params
@@ -225,203 +309,142 @@ class TestExtractUserParameters:
 class TestCommandHandlers:
     """Test command handler functions."""
 
-    @patch("src.mcp_config.main.setup_mcp_server")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_required_parameters")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_parameter_combination")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_setup_args")  # type: ignore[misc]
-    @patch("src.mcp_config.main.detect_python_environment")  # type: ignore[misc]
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    @patch("src.mcp_config.main.registry")  # type: ignore[misc]
-    def test_handle_setup_command_success(
+    @pytest.mark.parametrize(
+        "dry_run,venv_path",
+        [
+            pytest.param(False, VENV_PATH, id="success"),
+            pytest.param(True, None, id="dry_run"),
+        ],
+    )
+    def test_handle_setup_command(
         self,
-        mock_registry: Any,
-        mock_get_client: Any,
-        mock_detect: Any,
-        mock_validate_setup: Any,
-        mock_validate_combo: Any,
-        mock_validate: Any,
-        mock_setup: Any,
+        setup_command_mocks: SimpleNamespace,
+        make_args: Callable[..., Namespace],
+        dry_run: bool,
+        venv_path: Path | None,
     ) -> None:
-        """Test successful setup command handling."""
-        # Setup mocks
-        mock_config = MagicMock()
-        mock_config.name = "test-server"
-        mock_config.parameters = []
-        mock_registry.get.return_value = mock_config
-
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_detect.return_value = (Path("/usr/bin/python"), Path("/venv"))
-        mock_validate.return_value = []  # No validation errors
-        mock_validate_combo.return_value = []  # No combination errors
-        mock_validate_setup.return_value = []  # No setup validation errors
-        mock_setup.return_value = {"success": True, "backup_path": "/backup"}
+        """Test setup command handling with and without dry-run."""
+        setup_command_mocks.detect_python_environment.return_value = (
+            PYTHON_EXE,
+            venv_path,
+        )
 
-        args = Namespace(
-            server_type="test-server",
-            server_name="my-server",
-            client="claude-desktop",
-            dry_run=False,
-            verbose=False,
-            backup=True,
+        args = make_args(
+            server_type="test-server", server_name="my-server", dry_run=dry_run
         )
 
         result = handle_setup_command(args)
         assert result == 0
-        mock_setup.assert_called_once()
+        # Setup is only performed for real runs; dry-run only builds the config
+        assert setup_command_mocks.setup_mcp_server.call_count == (0 if dry_run else 1)
+        assert setup_command_mocks.build_server_config.call_count == (
+            1 if dry_run else 0
+        )
 
-    @patch("src.mcp_config.main.registry")  # type: ignore[misc]
-    def test_handle_setup_command_unknown_server(self, mock_registry: Any) -> None:
+    @patch.object(main_module, "registry")  # type: ignore[misc]
+    def test_handle_setup_command_unknown_server(
+        self, mock_registry: Any, make_args: Callable[..., Namespace]
+    ) -> None:
         """Test setup command with unknown server type."""
         mock_registry.get.return_value = None
         mock_registry.list_servers.return_value = ["server1", "server2"]
 
-        args = Namespace(
-            server_type="unknown",
-            server_name="test",
-            client="claude-desktop",
-            dry_run=False,
-            verbose=False,
-        )
+        args = make_args(server_type="unknown", server_name="test")
 
         result = handle_setup_command(args)
         assert result == 1
 
-    @patch("src.mcp_config.main.build_server_config")  # type: ignore[misc]
-    @patch("src.mcp_config.main.setup_mcp_server")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_required_parameters")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_parameter_combination")  # type: ignore[misc]
-    @patch("src.mcp_config.main.validate_setup_args")  # type: ignore[misc]
-    @patch("src.mcp_config.main.detect_python_environment")  # type: ignore[misc]
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    @patch("src.mcp_config.main.registry")  # type: ignore[misc]
-    def test_handle_setup_command_dry_run(
+    @patch.object(main_module, "remove_mcp_server")  # type: ignore[misc]
+    @patch.object(main_module, "get_client_handler")  # type: ignore[misc]
+    def test_handle_remove_command_success(
         self,
-        mock_registry: Any,
         mock_get_client: Any,
-        mock_detect: Any,
-        mock_validate_setup: Any,
-        mock_validate_combo: Any,
-        mock_validate: Any,
-        mock_setup: Any,
-        mock_build_config: Any,
-    ) -> None:
-        """Test setup command in dry-run mode."""
-        mock_config = MagicMock()
-        mock_config.name = "test-server"
-        mock_config.parameters = []
-        mock_registry.get.return_value = mock_config
-
-        mock_client = MagicMock()
-        mock_client.get_config_path.return_value = Path("/config.json")
-        mock_get_client.return_value = mock_client
-
-        mock_detect.return_value = (Path("/usr/bin/python"), None)
-        mock_validate.return_value = []
-        mock_validate_combo.return_value = []
-        mock_validate_setup.return_value = []
-
-        # Mock build_server_config to return a valid config dict
-        mock_build_config.return_value = {
-            "command": "/usr/bin/python",
-            "args": ["--project-dir", "/test"],
-            "_managed_by": "mcp-config-managed",
-            "_server_type": "test-server",
-        }
-
-        args = Namespace(
-            server_type="test-server",
-            server_name="my-server",
-            client="claude-desktop",
-            dry_run=True,
-            verbose=False,
-            backup=True,
-        )
-
-        result = handle_setup_command(args)
-        assert result == 0
-        mock_setup.assert_not_called()  # Should not call setup in dry-run
-        mock_build_config.assert_called_once()  # Should call build_server_config
-
-    @patch("src.mcp_config.main.remove_mcp_server")  # type: ignore[misc]
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    def test_handle_remove_command_success(
-        self, mock_get_client: Any, mock_remove: Any
+        mock_remove: Any,
+        make_args: Callable[..., Namespace],
     ) -> None:
         """Test successful remove command handling."""
-        mock_client = MagicMock()
-        mock_client.list_managed_servers.return_value = [
-            {"name": "test-server", "type": "test", "command": "test", "managed": True}
-        ]
-        mock_get_client.return_value = mock_client
+        mock_get_client.return_value = _mock_client(
+            list_managed_servers=[
+                {
+                    "name": "test-server",
+                    "type": "test",
+                    "command": "test",
+                    "managed": True,
+                }
+            ]
+        )
 
         mock_remove.return_value = {"success": True, "backup_path": "/backup"}
 
-        args = Namespace(
-            server_name="test-server",
-            client="claude-desktop",
-            dry_run=False,
-            verbose=False,
-            backup=True,
-        )
+        args = make_args(server_name="test-server")
 
         result = handle_remove_command(args)
         assert result == 0
         mock_remove.assert_called_once()
 
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    def test_handle_remove_command_not_managed(self, mock_get_client: Any) -> None:
+    @patch.object(main_module, "get_client_handler")  # type: ignore[misc]
+    def test_handle_remove_command_not_managed(
+        self, mock_get_client: Any, make_args: Callable[..., Namespace]
+    ) -> None:
         """Test remove command for non-managed server."""
-        mock_client = MagicMock()
-        mock_client.list_managed_servers.return_value = []
-        mock_client.list_all_servers.return_value = [
-            {
-                "name": "external-server",
-                "type": "test",
-                "command": "test",
-                "managed": False,
-            }
-        ]
-        mock_get_client.return_value = mock_client
-
-        args = Namespace(
-            server_name="external-server",
-            client="claude-desktop",
-            dry_run=False,
-            verbose=False,
+        mock_get_client.return_value = _mock_client(
+            list_managed_servers=[],
+            list_all_servers=[
+                {
+                    "name": "external-server",
+                    "type": "test",
+                    "command": "test",
+                    "managed": False,
+                }
+            ],
         )
 
+        args = make_args(server_name="external-server")
+
         result = handle_remove_command(args)
         assert result == 1
 
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    def test_handle_list_command_success(self, mock_get_client: Any) -> None:
+    @patch.object(main_module, "get_client_handler")  # type: ignore[misc]
+    def test_handle_list_command_success(
+        self, mock_get_client: Any, make_args: Callable[..., Namespace]
+    ) -> None:
         """Test successful list command handling."""
-        mock_client = MagicMock()
-        mock_client.get_config_path.return_value = Path("/config.json")
-        mock_client.list_all_servers.return_value = [
-            {"name": "server1", "type": "type1", "command": "cmd1", "managed": True},
-            {"name": "server2", "type": "type2", "command": "cmd2", "managed": False},
-        ]
-        mock_get_client.return_value = mock_client
+        mock_get_client.return_value = _mock_client(
+            get_config_path=CONFIG_PATH,
+            list_all_servers=[
+                {
+                    "name": "server1",
+                    "type": "type1",
+                    "command": "cmd1",
+                    "managed": True,
+                },
+                {
+                    "name": "server2",
+                    "type": "type2",
+                    "command": "cmd2",
+                    "managed": False,
+                },
+            ],
+        )
 
-        args = Namespace(client="claude-desktop", detailed=False, managed_only=False)
+        args = make_args(detailed=False, managed_only=False)
 
         result = handle_list_command(args)
         assert result == 0
 
-    @patch("src.mcp_config.main.get_client_handler")  # type: ignore[misc]
-    def test_handle_list_command_managed_only(self, mock_get_client: Any) -> None:
+    @patch.object(main_module, "get_client_handler")  # type: ignore[misc]
+    def test_handle_list_command_managed_only(
+        self, mock_get_client: Any, make_args: Callable[..., Namespace]
+    ) -> None:
         """Test list command with managed-only filter."""
-        mock_client = MagicMock()
-        mock_client.get_config_path.return_value = Path("/config.json")
-        mock_client.list_managed_servers.return_value = [
-            {"name": "server1", "type": "type1", "command": "cmd1", "managed": True}
-        ]
-        mock_get_client.return_value = mock_client
+        mock_get_client.return_value = _mock_client(
+            get_config_path=CONFIG_PATH,
+            list_managed_servers=[
+                {"name": "server1", "type": "type1", "command": "cmd1", "managed": True}
+            ],
+        )
 
-        args = Namespace(client="claude-desktop", detailed=False, managed_only=True)
+        args = make_args(detailed=False, managed_only=True)
 
         result = handle_list_command(args)
         assert result == 0
@@ -449,7 +472,7 @@ class TestOutputFormatterFunctions:
     def test_print_setup_summary(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test setup summary printing."""
         user_params = {
-            "project_dir": Path("/test"),
+            "project_dir": TEST_DIR,
             "debug": True,
             "log_level": "DEBUG",
             "python_executable": "/usr/bin/python",
@@ -469,10 +492,10 @@ class TestOutputFormatterFunctions:
 class TestMainFunction:
     """Test the main entry point."""
 
-    @patch("src.mcp_config.main.handle_setup_command")  # type: ignore[misc]
-    def test_main_setup_command(self, mock_handle: Any, monkeypatch: Any) -> None:
+    def test_main_setup_command(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test main function with setup command."""
-        mock_handle.return_value = 0
+        mock_handle = MagicMock(return_value=0)
+        monkeypatch.setattr(main_module, "handle_setup_command", mock_handle)
         monkeypatch.setattr(
             sys,
             "argv",
@@ -483,42 +506,43 @@ class TestMainFunction:
         assert result == 0
         mock_handle.assert_called_once()
 
-    @patch("src.mcp_config.main.handle_remove_command")  # type: ignore[misc]
-    def test_main_remove_command(self, mock_handle: Any, monkeypatch: Any) -> None:
+    def test_main_remove_command(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test main function with remove command."""
-        mock_handle.return_value = 0
+        mock_handle = MagicMock(return_value=0)
+        monkeypatch.setattr(main_module, "handle_remove_command", mock_handle)
         monkeypatch.setattr(sys, "argv", ["mcp-config", "remove", "test-server"])
 
         result = main()
         assert result == 0
         mock_handle.assert_called_once()
 
-    @patch("src.mcp_config.main.handle_list_command")  # type: ignore[misc]
-    def test_main_list_command(self, mock_handle: Any, monkeypatch: Any) -> None:
+    def test_main_list_command(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test main function with list command."""
-        mock_handle.return_value = 0
+        mock_handle = MagicMock(return_value=0)
+        monkeypatch.setattr(main_module, "handle_list_command", mock_handle)
         monkeypatch.setattr(sys, "argv", ["mcp-config", "list"])
 
         result = main()
         assert result == 0
         mock_handle.assert_called_once()
 
-    def test_main_keyboard_interrupt(self, monkeypatch: Any) -> None:
-        """Test handling of keyboard interrupt."""
-        monkeypatch.setattr(sys, "argv", ["mcp-config", "list"])
-
-        with patch("src.mcp_config.main.create_main_parser") as mock_parser:
-            mock_parser.side_effect = KeyboardInterrupt
-
-            result = main()
-            assert result == 1
-
-    def test_main_general_exception(self, monkeypatch: Any) -> None:
-        """Test handling of general exceptions."""
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(KeyboardInterrupt, id="keyboard_interrupt"),
+            pytest.param(Exception("Test error"), id="general_exception"),
+        ],
+    )
+    def test_main_error_paths(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        error: BaseException | type[BaseException],
+    ) -> None:
+        """Test that interrupts and unexpected errors make main return 1."""
         monkeypatch.setattr(sys, "argv", ["mcp-config", "list"])
+        monkeypatch.setattr(
+            main_module, "create_main_parser", MagicMock(side_effect=error)
+        )
 
-        with patch("src.mcp_config.main.create_main_parser") as mock_parser:
-            mock_parser.side_effect = Exception("Test error")
-
-            result = main()
-            assert result == 1
+        result = main()
+        assert result == 1
@@ -1,38 +1,56 @@
 """Tests for the output formatting module."""
 
+import contextlib
+import io
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from src.mcp_config.output import OutputFormatter
 
+# Arguments long enough to trigger truncation in detailed server listings
+LONG_ARGS = ["--" + "x" * 50] * 5
+
+
+@pytest.fixture(scope="module")
+def sample_servers() -> list[dict[str, Any]]:
+    """One managed and one external server, shared by the server list tests."""
+    return [
+        {
+            "name": "server1",
+            "type": "type1",
+            "managed": True,
+            "command": "python -m server1",
+            "args": ["--arg1", "--arg2"],
+        },
+        {
+            "name": "server2",
+            "type": "type2",
+            "managed": False,
+            "command": "node server2.js",
+        },
+    ]
+
 
 class TestOutputFormatter:
     """Test the OutputFormatter class."""
 
-    def test_print_success(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test success message formatting."""
-        OutputFormatter.print_success("Operation completed")
-        captured = capsys.readouterr()
-        assert "✓ Operation completed" in captured.out
-
-    def test_print_error(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test error message formatting."""
-        OutputFormatter.print_error("Operation failed")
-        captured = capsys.readouterr()
-        assert "✗ Operation failed" in captured.out
-
-    def test_print_info(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test info message formatting."""
-        OutputFormatter.print_info("Important information")
-        captured = capsys.readouterr()
-        assert "• Important information" in captured.out
-
-    def test_print_warning(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test warning message formatting."""
-        OutputFormatter.print_warning("This is a warning")
-        captured = capsys.readouterr()
-        assert "⚠ This is a warning" in captured.out
+    @pytest.mark.parametrize(
+        "method,symbol,message",
+        [
+            ("print_success", "✓", "Operation completed"),
+            ("print_error", "✗", "Operation failed"),
+            ("print_info", "•", "Important information"),
+            ("print_warning", "⚠", "This is a warning"),
+        ],
+    )
+    def test_print_message(self, method: str, symbol: str, message: str) -> None:
+        """Test that each message helper prefixes the message with its symbol."""
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            getattr(OutputFormatter, method)(message)
+        assert f"{symbol} {message}" in buffer.getvalue()
 
     def test_print_setup_summary(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test setup summary formatting."""
@@ -64,61 +82,52 @@ class TestOutputFormatter:
         captured = capsys.readouterr()
         assert "No servers configured" in captured.out
 
-    def test_print_server_list_basic(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test basic server list formatting."""
-        servers = [
-            {"name": "server1", "type": "type1", "managed": True},
-            {"name": "server2", "type": "type2", "managed": False},
-        ]
-
-        OutputFormatter.print_server_list(servers, detailed=False)
-        captured = capsys.readouterr()
-
-        assert "• server1 (type1)" in captured.out
-        assert "• server2 (external)" in captured.out
-
-    def test_print_server_list_detailed(
-        self, capsys: pytest.CaptureFixture[str]
+    @pytest.mark.parametrize(
+        "detailed,expected",
+        [
+            pytest.param(
+                False,
+                ["• server1 (type1)", "• server2 (external)"],
+                id="basic",
+            ),
+            pytest.param(
+                True,
+                [
+                    "• server1 (type1)",
+                    "Command: python -m server1",
+                    "Args: --arg1 --arg2",
+                    "• server2 (external)",
+                    "Command: node server2.js",
+                ],
+                id="detailed",
+            ),
+        ],
+    )
+    def test_print_server_list(
+        self,
+        capsys: pytest.CaptureFixture[str],
+        sample_servers: list[dict[str, Any]],
+        detailed: bool,
+        expected: list[str],
     ) -> None:
-        """Test detailed server list formatting."""
-        servers = [
-            {
-                "name": "server1",
-                "type": "type1",
-                "managed": True,
-                "command": "python -m server1",
-                "args": ["--arg1", "--arg2"],
-            },
-            {
-                "name": "server2",
-                "type": "type2",
-                "managed": False,
-                "command": "node server2.js",
-            },
-        ]
-
-        OutputFormatter.print_server_list(servers, detailed=True)
+        """Test basic and detailed server list formatting."""
+        OutputFormatter.print_server_list(sample_servers, detailed=detailed)
         captured = capsys.readouterr()
 
-        assert "• server1 (type1)" in captured.out
-        assert "Command: python -m server1" in captured.out
-        assert "Args: --arg1 --arg2" in captured.out
-
-        assert "• server2 (external)" in captured.out
-        assert "Command: node server2.js" in captured.out
+        for text in expected:
+            assert text in captured.out
 
     def test_print_server_list_long_args_truncation(
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """Test that long arguments are truncated."""
-        long_args = ["--" + "x" * 50 for _ in range(5)]
         servers = [
             {
                 "name": "server1",
                 "type": "type1",
                 "managed": True,
                 "command": "test",
-                "args": long_args,
+                "args": LONG_ARGS,
             }
         ]
 
@@ -154,69 +163,99 @@ class TestOutputFormatter:
 class TestOutputFormatterIntegration:
     """Integration tests for OutputFormatter."""
 
-    def test_complete_setup_output(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test complete setup output sequence."""
-        # Simulate a complete setup output
-        OutputFormatter.print_info("Starting server setup...")
-
-        params = {
-            "project_dir": Path("/my/project"),
-            "log_level": "INFO",
-            "debug": False,
-        }
-        OutputFormatter.print_setup_summary("my-checker", "mcp-code-checker", params)
-
-        OutputFormatter.print_success("Server configured successfully")
-
-        captured = capsys.readouterr()
-        assert "• Starting server setup..." in captured.out
-        assert "Setup Summary:" in captured.out
-        assert "✓ Server configured successfully" in captured.out
-
-    def test_complete_error_output(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test complete error output sequence."""
-        # Simulate an error scenario
-        OutputFormatter.print_info("Validating configuration...")
-
-        errors = [
-            "Project directory does not exist",
-            "Invalid Python executable",
-        ]
-        OutputFormatter.print_validation_errors(errors)
-
-        OutputFormatter.print_error("Setup failed due to validation errors")
-
-        captured = capsys.readouterr()
-        assert "• Validating configuration..." in captured.out
-        assert "Validation Errors:" in captured.out
-        assert "✗ Setup failed" in captured.out
-
-    def test_server_list_output_sequence(
-        self, capsys: pytest.CaptureFixture[str]
+    @pytest.mark.parametrize(
+        "calls,expected",
+        [
+            pytest.param(
+                [
+                    ("print_info", ("Starting server setup...",)),
+                    (
+                        "print_setup_summary",
+                        (
+                            "my-checker",
+                            "mcp-code-checker",
+                            {
+                                "project_dir": Path("/my/project"),
+                                "log_level": "INFO",
+                                "debug": False,
+                            },
+                        ),
+                    ),
+                    ("print_success", ("Server configured successfully",)),
+                ],
+                [
+                    "• Starting server setup...",
+                    "Setup Summary:",
+                    "✓ Server configured successfully",
+                ],
+                id="setup",
+            ),
+            pytest.param(
+                [
+                    ("print_info", ("Validating configuration...",)),
+                    (
+                        "print_validation_errors",
+                        (
+                            [
+                                "Project directory does not exist",
+                                "Invalid Python executable",
+                            ],
+                        ),
+                    ),
+                    ("print_error", ("Setup failed due to validation errors",)),
+                ],
+                [
+                    "• Validating configuration...",
+                    "Validation Errors:",
+                    "✗ Setup failed",
+                ],
+                id="error",
+            ),
+            pytest.param(
+                [
+                    ("print_info", ("Fetching server configurations...",)),
+                    (
+                        "print_server_list",
+                        (
+                            [
+                                {
+                                    "name": "checker1",
+                                    "type": "mcp-code-checker",
+                                    "managed": True,
+                                    "command": "python -m mcp_code_checker",
+                                },
+                                {
+                                    "name": "external",
+                                    "type": "custom",
+                                    "managed": False,
+                                    "command": "custom-server",
+                                },
+                            ],
+                            True,
+                        ),
+                    ),
+                    ("print_success", ("Found 2 servers",)),
+                ],
+                [
+                    "• Fetching server configurations...",
+                    "• checker1",
+                    "• external",
+                    "✓ Found 2 servers",
+                ],
+                id="list",
+            ),
+        ],
+    )
+    def test_output_sequence(
+        self,
+        capsys: pytest.CaptureFixture[str],
+        calls: list[tuple[str, tuple[Any, ...]]],
+        expected: list[str],
     ) -> None:
-        """Test server list output sequence."""
-        OutputFormatter.print_info("Fetching server configurations...")
-
-        servers = [
-            {
-                "name": "checker1",
-                "type": "mcp-code-checker",
-                "managed": True,
-                "command": "python -m mcp_code_checker",
-            },
-            {
-                "name": "external",
-                "type": "custom",
-                "managed": False,
-                "command": "custom-server",
-            },
-        ]
-
-        OutputFormatter.print_server_list(servers, detailed=True)
-        OutputFormatter.print_success(f"Found {len(servers)} servers")
+        """Test complete setup, error and server list output sequences."""
+        for method, args in calls:
+            getattr(OutputFormatter, method)(*args)
 
         captured = capsys.readouterr()
-        assert "• Fetching server configurations..." in captured.out
-        assert "• checker1" in captured.out
-        assert "• external" in captured.out
-        assert "✓ Found 2 servers" in captured.out
+        for text in expected:
+            assert text in captured.out
@@ -1,90 +1,128 @@
 """Tests for enhanced output formatting."""
 
-from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
 import pytest
 
 from src.mcp_config.output import OutputFormatter
+from tests.fixtures.assertions import assert_all_in
+
+# Read-only formatter inputs shared by the tests below
+VALIDATION_RESULT: dict[str, Any] = {
+    "success": True,
+    "checks": [
+        {
+            "status": "success",
+            "name": "Project directory",
+            "message": "Project directory exists: /test/path",
+        },
+        {
+            "status": "warning",
+            "name": "Test folder",
+            "message": "Test folder not found",
+        },
+        {
+            "status": "error",
+            "name": "Python executable",
+            "message": "Python executable not found",
+        },
+    ],
+    "warnings": ["Test folder missing"],
+    "suggestions": ["Create test folder: mkdir tests"],
+    "errors": [],
+}
+
+ENHANCED_SERVERS: list[dict[str, Any]] = [
+    {
+        "name": "my-checker",
+        "type": "mcp-code-checker",
+        "managed": True,
+        "command": "/usr/bin/python",
+        "args": ["--project-dir", "/test"],
+    },
+    {
+        "name": "external-server",
+        "type": "unknown",
+        "managed": False,
+        "command": "node",
+        "args": [],
+    },
+]
+
+REMOVE_SERVER_INFO: dict[str, Any] = {
+    "name": "my-checker",
+    "type": "mcp-code-checker",
+    "command": "/usr/bin/python",
+}
+
+OTHER_SERVERS: list[dict[str, Any]] = [
+    {"name": "other-server", "managed": True},
+    {"name": "external", "managed": False},
+]
 
 
 class TestOutputFormatter:
     """Test enhanced output formatting."""
 
-    def test_print_validation_results(self) -> None:
+    def test_print_validation_results(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test validation results formatting."""
-        validation_result = {
-            "success": True,
-            "checks": [
-                {
-                    "status": "success",
-                    "name": "Project directory",
-                    "message": "Project directory exists: /test/path",
-                },
-                {
-                    "status": "warning",
-                    "name": "Test folder",
-                    "message": "Test folder not found",
-                },
-                {
-                    "status": "error",
-                    "name": "Python executable",
-                    "message": "Python executable not found",
-                },
-            ],
-            "warnings": ["Test folder missing"],
-            "suggestions": ["Create test folder: mkdir tests"],
-            "errors": [],
-        }
-
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_validation_results(validation_result)
-            output = mock_stdout.getvalue()
-
-            # Check for status symbols
-            assert OutputFormatter.SUCCESS in output
-            assert OutputFormatter.WARNING in output
-            assert OutputFormatter.ERROR in output
-
+        OutputFormatter.print_validation_results(VALIDATION_RESULT)
+        output = capsys.readouterr().out
+
+        # Check for status symbols
+        assert_all_in(
+            output,
+            OutputFormatter.SUCCESS,
+            OutputFormatter.WARNING,
+            OutputFormatter.ERROR,
             # Check for messages
-            assert "Project directory exists" in output
-            assert "Test folder not found" in output
-            assert "Python executable not found" in output
+            "Project directory exists",
+            "Test folder not found",
+            "Python executable not found",
+        )
 
-            # Simplified version no longer shows suggestions
+        # Simplified version no longer shows suggestions
 
-    def test_print_configuration_details(self) -> None:
+    def test_print_configuration_details(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test configuration details formatting."""
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_configuration_details(
-                "my-checker",
-                "mcp-code-checker",
-                {
-                    "project_dir": "/test/path",
-                    "python_executable": "/usr/bin/python3",
-                    "log_level": "INFO",
-                },
-                _tree_format=True,
-            )
-            output = mock_stdout.getvalue()
-
-            # Check content
-            assert "my-checker" in output
-            assert "mcp-code-checker" in output
-            assert "/test/path" in output
-            assert "INFO" in output
-
-    def test_print_dry_run_header(self) -> None:
+        OutputFormatter.print_configuration_details(
+            "my-checker",
+            "mcp-code-checker",
+            {
+                "project_dir": "/test/path",
+                "python_executable": "/usr/bin/python3",
+                "log_level": "INFO",
+            },
+            _tree_format=True,
+        )
+        output = capsys.readouterr().out
+
+        # Check content
+        assert_all_in(
+            output,
+            "my-checker",
+            "mcp-code-checker",
+            "/test/path",
+            "INFO",
+        )
+
+    def test_print_dry_run_header(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test dry-run header formatting."""
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_dry_run_header()
-            output = mock_stdout.getvalue()
-
-            assert "DRY RUN" in output
-            assert "No changes will be applied" in output
-
-    def test_print_auto_detected_params(self) -> None:
+        OutputFormatter.print_dry_run_header()
+        output = capsys.readouterr().out
+
+        assert_all_in(
+            output,
+            "DRY RUN",
+            "No changes will be applied",
+        )
+
+    def test_print_auto_detected_params(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test auto-detected parameters formatting."""
         params = {
             "python_executable": "/home/user/.venv/bin/python",
@@ -94,54 +132,43 @@ class TestOutputFormatter:
             "log_level": "INFO",
         }
 
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_auto_detected_params(params)
-            output = mock_stdout.getvalue()
+        OutputFormatter.print_auto_detected_params(params)
+        output = capsys.readouterr().out
 
-            assert "Auto-detected parameters" in output
-            assert "Python Executable" in output
-            assert "Venv Path" in output
+        assert_all_in(
+            output,
+            "Auto-detected parameters",
+            "Python Executable",
+            "Venv Path",
+        )
 
-    def test_print_enhanced_server_list(self, tmp_path: Path) -> None:
+    def test_print_enhanced_server_list(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test enhanced server list formatting."""
-        servers = [
-            {
-                "name": "my-checker",
-                "type": "mcp-code-checker",
-                "managed": True,
-                "command": "/usr/bin/python",
-                "args": ["--project-dir", "/test"],
-            },
-            {
-                "name": "external-server",
-                "type": "unknown",
-                "managed": False,
-                "command": "node",
-                "args": [],
-            },
-        ]
-
         config_path = tmp_path / "config.json"
         config_path.touch()
 
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_enhanced_server_list(
-                servers, "claude-desktop", config_path, detailed=True
-            )
-            output = mock_stdout.getvalue()
-
-            # Check sections - updated to match new display name
-            assert "MCP Servers for Claude Desktop" in output
+        OutputFormatter.print_enhanced_server_list(
+            ENHANCED_SERVERS, "claude-desktop", config_path, detailed=True
+        )
+        output = capsys.readouterr().out
 
+        # Check sections - updated to match new display name
+        assert_all_in(
+            output,
+            "MCP Servers for Claude Desktop",
             # Check server names
-            assert "my-checker" in output
-            assert "external-server" in output
-
+            "my-checker",
+            "external-server",
             # Check detailed info
-            assert "/usr/bin/python" in output
-            # Args are not shown in enhanced list (simplified)
+            "/usr/bin/python",
+        )
+        # Args are not shown in enhanced list (simplified)
 
-    def test_print_dry_run_config_preview(self, tmp_path: Path) -> None:
+    def test_print_dry_run_config_preview(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test dry-run configuration preview."""
         config = {
             "command": "/usr/bin/python",
@@ -155,56 +182,44 @@ class TestOutputFormatter:
         config_path = tmp_path / "config.json"
         backup_path = tmp_path / "config.backup.json"
 
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_dry_run_config_preview(
-                config, config_path, backup_path
-            )
-            output = mock_stdout.getvalue()
-
-            # Check simplified output format
-            assert "Would update configuration" in output
-            assert "Server: test-server" in output
-            assert "Type: mcp-code-checker" in output
+        OutputFormatter.print_dry_run_config_preview(config, config_path, backup_path)
+        output = capsys.readouterr().out
 
+        # Check simplified output format
+        assert_all_in(
+            output,
+            "Would update configuration",
+            "Server: test-server",
+            "Type: mcp-code-checker",
             # Check paths
-            assert str(config_path) in output
-            assert str(backup_path) in output
-
+            str(config_path),
+            str(backup_path),
             # Check success message
-            assert "Configuration valid" in output
-            assert "Run without --dry-run" in output
+            "Configuration valid",
+            "Run without --dry-run",
+        )
 
-    def test_print_dry_run_remove_preview(self, tmp_path: Path) -> None:
+    def test_print_dry_run_remove_preview(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test dry-run removal preview."""
-        server_info = {
-            "name": "my-checker",
-            "type": "mcp-code-checker",
-            "command": "/usr/bin/python",
-        }
-
-        other_servers = [
-            {"name": "other-server", "managed": True},
-            {"name": "external", "managed": False},
-        ]
-
         config_path = tmp_path / "config.json"
         backup_path = tmp_path / "backup.json"
 
-        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-            OutputFormatter.print_dry_run_remove_preview(
-                "my-checker", server_info, other_servers, config_path, backup_path
-            )
-            output = mock_stdout.getvalue()
-
-            assert "Would remove server 'my-checker'" in output
-            assert "mcp-code-checker" in output
+        OutputFormatter.print_dry_run_remove_preview(
+            "my-checker", REMOVE_SERVER_INFO, OTHER_SERVERS, config_path, backup_path
+        )
+        output = capsys.readouterr().out
 
+        assert_all_in(
+            output,
+            "Would remove server 'my-checker'",
+            "mcp-code-checker",
             # Check preservation message for other servers
-            assert "Preserving 2 other server(s)" in output
-
+            "Preserving 2 other server(s)",
             # Check paths
-            assert str(config_path) in output
-            assert str(backup_path) in output
-
+            str(config_path),
+            str(backup_path),
             # Check success message
-            assert "Removal safe" in output
+            "Removal safe",
+        )
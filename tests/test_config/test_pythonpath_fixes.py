@@ -14,43 +14,56 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.mcp_config.integration import generate_client_config
-from src.mcp_config.servers import MCP_CODE_CHECKER, MCP_FILESYSTEM_SERVER
+from src.mcp_config.servers import (
+    MCP_CODE_CHECKER,
+    MCP_FILESYSTEM_SERVER,
+    ServerConfig,
+)
+from tests.fixtures.fake_venv import FakeVenvLayout
+
+# Platform-specific pieces, picked once at import
+if sys.platform == "win32":
+    _FAKE_SCRIPTS_DIR = r"C:\path\to\.venv\Scripts"
+    _EXE_SUFFIX = ".exe"
+    _EXPECTED_TRAILING_SEP = "\\"
+else:
+    _FAKE_SCRIPTS_DIR = "/path/to/.venv/bin"
+    _EXE_SUFFIX = ""
+    _EXPECTED_TRAILING_SEP = ""
+
+
+def _path_with_trailing_sep(path: Path) -> str:
+    """Format path the way PYTHONPATH is written (trailing separator on Windows)."""
+    path_str = str(path)
+    if not path_str.endswith(_EXPECTED_TRAILING_SEP):
+        path_str += _EXPECTED_TRAILING_SEP
+    return path_str
+
+
+def _fake_cli_path(command_name: str) -> str:
+    """Return a non-existent but platform-shaped path to a CLI executable."""
+    return str(Path(_FAKE_SCRIPTS_DIR) / f"{command_name}{_EXE_SUFFIX}")
 
 
 class TestPythonPathConfiguration:
     """Test that PYTHONPATH is correctly set to mcp-config directory, not project directory."""
 
     def test_pythonpath_should_use_mcp_config_dir_not_project_dir(
-        self, tmp_path: Path
+        self,
+        tmp_path: Path,
+        fake_venv_layout: FakeVenvLayout,
+        patched_find_cli: dict[str, str],
     ) -> None:
         """Test that PYTHONPATH points to mcp-config directory where the virtual environment is."""
         # Setup paths
         project_dir = tmp_path / "mcp_coder_dummy"
         project_dir.mkdir()
 
-        mcp_config_dir = tmp_path / "mcp-config"
-        mcp_config_dir.mkdir()
-
-        # Create a fake virtual environment in mcp-config
-        venv_path = mcp_config_dir / ".venv"
-        venv_path.mkdir()
-
-        if sys.platform == "win32":
-            scripts_dir = venv_path / "Scripts"
-            scripts_dir.mkdir()
-            python_exe = scripts_dir / "python.exe"
-            checker_exe = scripts_dir / "mcp-code-checker.exe"
-            filesystem_exe = scripts_dir / "mcp-server-filesystem.exe"
-        else:
-            bin_dir = venv_path / "bin"
-            bin_dir.mkdir()
-            python_exe = bin_dir / "python"
-            checker_exe = bin_dir / "mcp-code-checker"
-            filesystem_exe = bin_dir / "mcp-server-filesystem"
-
-        python_exe.touch()
-        checker_exe.touch()
-        filesystem_exe.touch()
+        # Fake virtual environment in mcp-config
+        mcp_config_dir = fake_venv_layout.mcp_config_dir
+        venv_path = fake_venv_layout.venv_path
+        python_exe = fake_venv_layout.python_exe
+        checker_exe = fake_venv_layout.checker_exe
 
         # Test for MCP Code Checker with explicit venv_path
         user_params = {
@@ -59,33 +72,32 @@ class TestPythonPathConfiguration:
             "log_level": "INFO",
         }
 
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            mock_find.return_value = str(checker_exe)
+        patched_find_cli["mcp-code-checker"] = str(checker_exe)
 
-            config = generate_client_config(
-                MCP_CODE_CHECKER,
-                "checker on p coder_dummy",
-                user_params,
-                python_executable=str(python_exe),
-            )
+        config = generate_client_config(
+            MCP_CODE_CHECKER,
+            "checker on p coder_dummy",
+            user_params,
+            python_executable=str(python_exe),
+        )
 
-            # PYTHONPATH should point to mcp-config directory, NOT project directory
-            assert "env" in config
-            assert "PYTHONPATH" in config["env"]
+        # PYTHONPATH should point to mcp-config directory, NOT project directory
+        assert "env" in config
+        assert "PYTHONPATH" in config["env"]
 
-            pythonpath = config["env"]["PYTHONPATH"]
+        pythonpath = config["env"]["PYTHONPATH"]
 
-            # With venv_path provided, should use venv's parent (mcp_config_dir)
-            expected_path = str(mcp_config_dir)
-            if sys.platform == "win32" and not expected_path.endswith("\\"):
-                expected_path += "\\"
+        # With venv_path provided, should use venv's parent (mcp_config_dir)
+        expected_path = _path_with_trailing_sep(mcp_config_dir)
 
-            assert pythonpath == expected_path, (
-                f"PYTHONPATH should be mcp-config dir ({expected_path}), "
-                f"not project dir ({project_dir})"
-            )
+        assert pythonpath == expected_path, (
+            f"PYTHONPATH should be mcp-config dir ({expected_path}), "
+            f"not project dir ({project_dir})"
+        )
 
-    def test_pythonpath_uses_module_location_not_cwd(self, tmp_path: Path) -> None:
+    def test_pythonpath_uses_module_location_not_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that PYTHONPATH uses module location, not current working directory."""
         # Create a project directory that's different from mcp-config location
         project_dir = tmp_path / "user_project"
@@ -97,60 +109,39 @@ class TestPythonPathConfiguration:
         }
 
         # Change to project directory to simulate real user scenario
-        original_cwd = Path.cwd()
-        try:
-            import os
-
-            os.chdir(project_dir)
+        monkeypatch.chdir(project_dir)
 
-            config = generate_client_config(
-                MCP_CODE_CHECKER,
-                "test",
-                user_params,
-            )
-
-            pythonpath = config["env"]["PYTHONPATH"]
+        config = generate_client_config(
+            MCP_CODE_CHECKER,
+            "test",
+            user_params,
+        )
 
-            # PYTHONPATH should NOT be the current working directory (project_dir)
-            project_path = str(project_dir)
-            if sys.platform == "win32" and not project_path.endswith("\\"):
-                project_path += "\\"
+        pythonpath = config["env"]["PYTHONPATH"]
 
-            assert pythonpath != project_path, (
-                f"PYTHONPATH should not be current working directory ({project_path}), "
-                f"but got {pythonpath}"
-            )
+        # PYTHONPATH should NOT be the current working directory (project_dir)
+        project_path = _path_with_trailing_sep(project_dir)
 
-            # PYTHONPATH should be the actual mcp-config installation directory
-            # (We can't easily test the exact path, but we can verify it's not the project dir)
-            assert Path(
-                pythonpath.rstrip("\\")
-            ).exists(), f"PYTHONPATH directory should exist: {pythonpath}"
+        assert pythonpath != project_path, (
+            f"PYTHONPATH should not be current working directory ({project_path}), "
+            f"but got {pythonpath}"
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        # PYTHONPATH should be the actual mcp-config installation directory
+        # (We can't easily test the exact path, but we can verify it's not the project dir)
+        assert Path(
+            pythonpath.rstrip("\\")
+        ).exists(), f"PYTHONPATH directory should exist: {pythonpath}"
 
-    def test_pythonpath_with_explicit_venv(self, tmp_path: Path) -> None:
+    def test_pythonpath_with_explicit_venv(
+        self, tmp_path: Path, fake_venv_layout: FakeVenvLayout
+    ) -> None:
         """Test PYTHONPATH when venv is explicitly provided."""
         project_dir = tmp_path / "my_project"
         project_dir.mkdir()
 
-        mcp_config_dir = tmp_path / "mcp-config"
-        mcp_config_dir.mkdir()
-
-        venv_path = mcp_config_dir / ".venv"
-        venv_path.mkdir()
-
-        if sys.platform == "win32":
-            scripts_dir = venv_path / "Scripts"
-            scripts_dir.mkdir()
-            python_exe = scripts_dir / "python.exe"
-        else:
-            bin_dir = venv_path / "bin"
-            bin_dir.mkdir()
-            python_exe = bin_dir / "python"
-
-        python_exe.touch()
+        mcp_config_dir = fake_venv_layout.mcp_config_dir
+        venv_path = fake_venv_layout.venv_path
 
         user_params = {
             "project_dir": str(project_dir),
@@ -170,9 +161,7 @@ class TestPythonPathConfiguration:
             pythonpath = config["env"]["PYTHONPATH"]
 
             # The PYTHONPATH should be the parent of venv (mcp-config dir)
-            expected_path = str(mcp_config_dir)
-            if sys.platform == "win32" and not expected_path.endswith("\\"):
-                expected_path += "\\"
+            expected_path = _path_with_trailing_sep(mcp_config_dir)
 
             assert pythonpath == expected_path
 
@@ -181,7 +170,7 @@ class TestFilesystemServerArguments:
     """Test that mcp-server-filesystem doesn't get unnecessary arguments."""
 
     def test_filesystem_server_should_not_have_python_executable_arg(
-        self, tmp_path: Path
+        self, tmp_path: Path, patched_find_cli: dict[str, str]
     ) -> None:
         """Test that filesystem server doesn't include --python-executable in its arguments."""
         project_dir = tmp_path / "test_project"
@@ -193,30 +182,26 @@ class TestFilesystemServerArguments:
         }
 
         # Mock CLI command availability
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            # Simulate CLI command is available
-            if sys.platform == "win32":
-                mock_find.return_value = (
-                    r"C:\path\to\.venv\Scripts\mcp-server-filesystem.exe"
-                )
-            else:
-                mock_find.return_value = "/path/to/.venv/bin/mcp-server-filesystem"
+        # Simulate CLI command is available
+        patched_find_cli["mcp-server-filesystem"] = _fake_cli_path(
+            "mcp-server-filesystem"
+        )
 
-            config = generate_client_config(
-                MCP_FILESYSTEM_SERVER,
-                "fs on p coder_dummy",
-                user_params,
-                python_executable="/usr/bin/python3",
-            )
+        config = generate_client_config(
+            MCP_FILESYSTEM_SERVER,
+            "fs on p coder_dummy",
+            user_params,
+            python_executable="/usr/bin/python3",
+        )
 
-            # Check that --python-executable is NOT in the arguments
-            # This test should FAIL with current implementation
-            assert (
-                "--python-executable" not in config["args"]
-            ), "mcp-server-filesystem should not have --python-executable argument"
+        # Check that --python-executable is NOT in the arguments
+        # This test should FAIL with current implementation
+        assert (
+            "--python-executable" not in config["args"]
+        ), "mcp-server-filesystem should not have --python-executable argument"
 
     def test_code_checker_should_have_python_executable_arg(
-        self, tmp_path: Path
+        self, tmp_path: Path, patched_find_cli: dict[str, str]
     ) -> None:
         """Test that code checker DOES include --python-executable in its arguments."""
         project_dir = tmp_path / "test_project"
@@ -228,79 +213,50 @@ class TestFilesystemServerArguments:
         }
 
         # Mock CLI command availability
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            # Simulate CLI command is available
-            if sys.platform == "win32":
-                mock_find.return_value = (
-                    r"C:\path\to\.venv\Scripts\mcp-code-checker.exe"
-                )
-            else:
-                mock_find.return_value = "/path/to/.venv/bin/mcp-code-checker"
-
-            config = generate_client_config(
-                MCP_CODE_CHECKER,
-                "checker on p coder_dummy",
-                user_params,
-                python_executable="/usr/bin/python3",
-            )
-
-            # Check that --python-executable IS in the arguments for code checker
-            assert (
-                "--python-executable" in config["args"]
-            ), "mcp-code-checker should have --python-executable argument"
-
-
-class TestLogFileArguments:
-    """Test that log-file arguments are not automatically generated."""
-
-    def test_log_file_should_not_be_auto_generated_for_code_checker(
-        self, tmp_path: Path
-    ) -> None:
-        """Test that log-file is not automatically added to code checker arguments."""
-        project_dir = tmp_path / "test_project"
-        project_dir.mkdir()
-
-        user_params = {
-            "project_dir": str(project_dir),
-            "log_level": "INFO",
-            # Note: NOT providing log_file parameter
-        }
+        # Simulate CLI command is available
+        patched_find_cli["mcp-code-checker"] = _fake_cli_path("mcp-code-checker")
 
         config = generate_client_config(
             MCP_CODE_CHECKER,
             "checker on p coder_dummy",
             user_params,
+            python_executable="/usr/bin/python3",
         )
 
-        # This test should FAIL with current implementation
-        # because auto_detect_log_file is called and adds log-file argument
+        # Check that --python-executable IS in the arguments for code checker
         assert (
-            "--log-file" not in config["args"]
-        ), "log-file should not be auto-generated, let the server handle it"
+            "--python-executable" in config["args"]
+        ), "mcp-code-checker should have --python-executable argument"
 
-    def test_log_file_should_not_be_auto_generated_for_filesystem_server(
-        self, tmp_path: Path
+
+class TestLogFileArguments:
+    """Test that log-file arguments are not automatically generated."""
+
+    @pytest.mark.parametrize(
+        "server",
+        [MCP_CODE_CHECKER, MCP_FILESYSTEM_SERVER],
+        ids=["code_checker", "filesystem"],
+    )
+    @pytest.mark.parametrize(
+        "extra_params",
+        [{"log_level": "INFO"}, {}],
+        ids=["with_log_level", "project_dir_only"],
+    )
+    def test_log_file_should_not_be_auto_generated(
+        self, tmp_path: Path, server: ServerConfig, extra_params: dict[str, str]
     ) -> None:
-        """Test that log-file is not automatically added to filesystem server arguments."""
+        """Test that log-file is not automatically added to server arguments."""
         project_dir = tmp_path / "test_project"
         project_dir.mkdir()
 
-        user_params = {
-            "project_dir": str(project_dir),
-            "log_level": "INFO",
-            # Note: NOT providing log_file parameter
-        }
+        # Note: NOT providing log_file parameter
+        user_params = {"project_dir": str(project_dir), **extra_params}
 
-        config = generate_client_config(
-            MCP_FILESYSTEM_SERVER,
-            "fs on p coder_dummy",
-            user_params,
-        )
+        config = generate_client_config(server, "server", user_params)
 
-        # This test should FAIL with current implementation
         assert (
             "--log-file" not in config["args"]
-        ), "log-file should not be auto-generated for filesystem server"
+        ), f"log-file should not be auto-generated for {server.name}"
 
     def test_explicit_log_file_should_be_included(self, tmp_path: Path) -> None:
         """Test that explicitly provided log-file IS included in arguments."""
@@ -330,30 +286,26 @@ class TestCompleteConfigurationExamples:
     """Test complete configurations matching the examples from the issue report."""
 
     @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific test")
-    def test_windows_configuration_example(self, tmp_path: Path) -> None:
+    def test_windows_configuration_example(
+        self,
+        tmp_path: Path,
+        fake_venv_layout: FakeVenvLayout,
+        patched_find_cli: dict[str, str],
+    ) -> None:
         """Test that configuration matches the expected valid config from the issue."""
         # Simulate the paths from the example
         mcp_config_dir = Path(r"C:\Users\Marcu\Documents\GitHub\mcp-config")
         project_dir = Path(r"C:\Users\Marcu\Documents\GitHub\mcp_coder_dummy")
 
-        # We'll use tmp_path to avoid actually creating these directories
-        mock_mcp_config = tmp_path / "mcp-config"
+        # We'll use temporary directories to avoid actually creating these directories
+        mock_mcp_config = fake_venv_layout.mcp_config_dir
         mock_project = tmp_path / "mcp_coder_dummy"
-        mock_mcp_config.mkdir()
         mock_project.mkdir()
 
-        venv_path = mock_mcp_config / ".venv"
-        venv_path.mkdir()
-        scripts_dir = venv_path / "Scripts"
-        scripts_dir.mkdir()
-
-        checker_exe = scripts_dir / "mcp-code-checker.exe"
-        filesystem_exe = scripts_dir / "mcp-server-filesystem.exe"
-        python_exe = scripts_dir / "python.exe"
-
-        checker_exe.touch()
-        filesystem_exe.touch()
-        python_exe.touch()
+        venv_path = fake_venv_layout.venv_path
+        checker_exe = fake_venv_layout.checker_exe
+        filesystem_exe = fake_venv_layout.filesystem_exe
+        python_exe = fake_venv_layout.python_exe
 
         # Test Code Checker configuration
         user_params = {
@@ -363,35 +315,32 @@ class TestCompleteConfigurationExamples:
             "log_level": "INFO",
         }
 
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            with patch(
-                "src.mcp_config.integration.get_server_command_mode"
-            ) as mock_mode:
-                mock_find.return_value = str(checker_exe)
-                mock_mode.return_value = "cli_command"  # Force CLI mode
-
-                config = generate_client_config(
-                    MCP_CODE_CHECKER,
-                    "checker on p coder_dummy",
-                    user_params,
-                    python_executable=str(python_exe),
-                )
-
-                # Verify command
-                assert str(checker_exe) in config["command"]
-
-            # Verify arguments
-            args = config["args"]
-            assert "--project-dir" in args
-            assert "--test-folder" in args
-            assert "tests" in args
-            assert "--log-level" in args
-            assert "INFO" in args
-            assert "--log-file" not in args  # Should not be auto-generated
-
-            # Verify PYTHONPATH points to mcp-config, not project
-            expected_pythonpath = str(mock_mcp_config) + "\\"
-            assert config["env"]["PYTHONPATH"] == expected_pythonpath
+        with patch("src.mcp_config.integration.get_server_command_mode") as mock_mode:
+            patched_find_cli["mcp-code-checker"] = str(checker_exe)
+            mock_mode.return_value = "cli_command"  # Force CLI mode
+
+            config = generate_client_config(
+                MCP_CODE_CHECKER,
+                "checker on p coder_dummy",
+                user_params,
+                python_executable=str(python_exe),
+            )
+
+            # Verify command
+            assert str(checker_exe) in config["command"]
+
+        # Verify arguments
+        args = config["args"]
+        assert "--project-dir" in args
+        assert "--test-folder" in args
+        assert "tests" in args
+        assert "--log-level" in args
+        assert "INFO" in args
+        assert "--log-file" not in args  # Should not be auto-generated
+
+        # Verify PYTHONPATH points to mcp-config, not project
+        expected_pythonpath = str(mock_mcp_config) + "\\"
+        assert config["env"]["PYTHONPATH"] == expected_pythonpath
 
         # Test Filesystem Server configuration
         user_params_fs = {
@@ -400,74 +349,59 @@ class TestCompleteConfigurationExamples:
             "log_level": "INFO",
         }
 
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            with patch(
-                "src.mcp_config.integration.get_server_command_mode"
-            ) as mock_mode:
-                mock_find.return_value = str(filesystem_exe)
-                mock_mode.return_value = "cli_command"  # Force CLI mode
-
-                config_fs = generate_client_config(
-                    MCP_FILESYSTEM_SERVER,
-                    "fs on p coder_dummy",
-                    user_params_fs,
-                    python_executable=str(python_exe),
-                )
-
-                # Verify command
-                assert str(filesystem_exe) in config_fs["command"]
-
-            # Verify arguments
-            args_fs = config_fs["args"]
-            assert "--project-dir" in args_fs
-            assert "--log-level" in args_fs
-            assert "INFO" in args_fs
-            assert "--python-executable" not in args_fs  # Should not be present
-            assert "--log-file" not in args_fs  # Should not be auto-generated
-
-            # Verify PYTHONPATH for filesystem server
-            # Note: Filesystem server strips venv_path in CLI mode, so it will use
-            # the actual mcp-config directory, not the test directory
-            fs_pythonpath = config_fs["env"]["PYTHONPATH"]
-
-            # For code checker with venv_path, should use test directory
-            assert config["env"]["PYTHONPATH"] == expected_pythonpath
+        with patch("src.mcp_config.integration.get_server_command_mode") as mock_mode:
+            patched_find_cli["mcp-server-filesystem"] = str(filesystem_exe)
+            mock_mode.return_value = "cli_command"  # Force CLI mode
 
-            # For filesystem server, venv_path is stripped in CLI mode, so it uses actual mcp-config dir
-            # We just verify it's not the project directory
-            project_path = str(mock_project) + "\\"
-            assert fs_pythonpath != project_path, (
-                f"Filesystem server PYTHONPATH should not be project dir ({project_path}), "
-                f"got {fs_pythonpath}"
+            config_fs = generate_client_config(
+                MCP_FILESYSTEM_SERVER,
+                "fs on p coder_dummy",
+                user_params_fs,
+                python_executable=str(python_exe),
             )
 
-    def test_unix_configuration(self, tmp_path: Path) -> None:
-        """Test configuration on Unix-like systems."""
-        if sys.platform == "win32":
-            pytest.skip("Unix-specific test")
+            # Verify command
+            assert str(filesystem_exe) in config_fs["command"]
+
+        # Verify arguments
+        args_fs = config_fs["args"]
+        assert "--project-dir" in args_fs
+        assert "--log-level" in args_fs
+        assert "INFO" in args_fs
+        assert "--python-executable" not in args_fs  # Should not be present
+        assert "--log-file" not in args_fs  # Should not be auto-generated
+
+        # Verify PYTHONPATH for filesystem server
+        # Note: Filesystem server strips venv_path in CLI mode, so it will use
+        # the actual mcp-config directory, not the test directory
+        fs_pythonpath = config_fs["env"]["PYTHONPATH"]
+
+        # For code checker with venv_path, should use test directory
+        assert config["env"]["PYTHONPATH"] == expected_pythonpath
+
+        # For filesystem server, venv_path is stripped in CLI mode, so it uses actual mcp-config dir
+        # We just verify it's not the project directory
+        project_path = str(mock_project) + "\\"
+        assert fs_pythonpath != project_path, (
+            f"Filesystem server PYTHONPATH should not be project dir ({project_path}), "
+            f"got {fs_pythonpath}"
+        )
 
-        mcp_config_dir = tmp_path / "mcp-config"
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix-specific test")
+    def test_unix_configuration(
+        self,
+        tmp_path: Path,
+        fake_venv_layout: FakeVenvLayout,
+        patched_find_cli: dict[str, str],
+    ) -> None:
+        """Test configuration on Unix-like systems."""
+        mcp_config_dir = fake_venv_layout.mcp_config_dir
         project_dir = tmp_path / "mcp_coder_dummy"
-        mcp_config_dir.mkdir()
         project_dir.mkdir()
 
-        venv_path = mcp_config_dir / ".venv"
-        venv_path.mkdir()
-        bin_dir = venv_path / "bin"
-        bin_dir.mkdir()
-
-        checker_exe = bin_dir / "mcp-code-checker"
-        filesystem_exe = bin_dir / "mcp-server-filesystem"
-        python_exe = bin_dir / "python"
-
-        checker_exe.touch()
-        filesystem_exe.touch()
-        python_exe.touch()
-
-        # Make executables actually executable on Unix
-        checker_exe.chmod(0o755)
-        filesystem_exe.chmod(0o755)
-        python_exe.chmod(0o755)
+        venv_path = fake_venv_layout.venv_path
+        filesystem_exe = fake_venv_layout.filesystem_exe
+        python_exe = fake_venv_layout.python_exe
 
         # Test configuration
         user_params = {
@@ -477,13 +411,10 @@ class TestCompleteConfigurationExamples:
         }
 
         # Mock the mcp-config directory detection to use our test directory
-        with (
-            patch("src.mcp_config.integration._find_cli_executable") as mock_find,
-            patch(
-                "src.mcp_config.integration._detect_mcp_config_directory"
-            ) as mock_detect,
-        ):
-            mock_find.return_value = str(filesystem_exe)
+        with patch(
+            "src.mcp_config.integration._detect_mcp_config_directory"
+        ) as mock_detect:
+            patched_find_cli["mcp-server-filesystem"] = str(filesystem_exe)
             mock_detect.return_value = mcp_config_dir  # Use our test mcp-config dir
 
             config = generate_client_config(
@@ -508,7 +439,7 @@ class TestServerSpecificBehavior:
     """Test that different servers have appropriate different behaviors."""
 
     def test_code_checker_vs_filesystem_parameter_differences(
-        self, tmp_path: Path
+        self, tmp_path: Path, patched_find_cli: dict[str, str]
     ) -> None:
         """Test that code checker and filesystem server have correct parameter differences."""
         project_dir = tmp_path / "project"
@@ -545,46 +476,18 @@ class TestServerSpecificBehavior:
         assert checker_pythonpath == fs_pythonpath
 
         # PYTHONPATH should NOT be the project directory
-        project_path = str(project_dir)
-        if sys.platform == "win32" and not project_path.endswith("\\"):
-            project_path += "\\"
+        project_path = _path_with_trailing_sep(project_dir)
         assert checker_pythonpath != project_path
         assert fs_pythonpath != project_path
 
         # Code checker may have python-executable, filesystem should not
         # (when using CLI commands)
-        with patch("src.mcp_config.integration._find_cli_executable") as mock_find:
-            mock_find.return_value = "/usr/bin/mcp-server-filesystem"
-
-            fs_config_cli = generate_client_config(
-                MCP_FILESYSTEM_SERVER,
-                "fs",
-                user_params,
-            )
-
-            assert "--python-executable" not in fs_config_cli["args"]
+        patched_find_cli["mcp-server-filesystem"] = "/usr/bin/mcp-server-filesystem"
 
-    def test_both_servers_no_auto_log_file(self, tmp_path: Path) -> None:
-        """Test that neither server gets auto-generated log files."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-
-        user_params = {
-            "project_dir": str(project_dir),
-        }
-
-        checker_config = generate_client_config(
-            MCP_CODE_CHECKER,
-            "checker",
-            user_params,
-        )
-
-        fs_config = generate_client_config(
+        fs_config_cli = generate_client_config(
             MCP_FILESYSTEM_SERVER,
             "fs",
             user_params,
         )
 
-        # Neither should have auto-generated log files
-        assert "--log-file" not in checker_config["args"]
-        assert "--log-file" not in fs_config["args"]
+        assert "--python-executable" not in fs_config_cli["args"]
@@ -8,23 +8,50 @@ import json
 import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 # Import the modules we need to test
 from src.mcp_config.integration import generate_client_config
-from src.mcp_config.servers import MCP_FILESYSTEM_SERVER, registry
+from src.mcp_config.servers import MCP_CODE_CHECKER, MCP_FILESYSTEM_SERVER, registry
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for file-writing functions; does nothing."""
 
 
 class TestMCPSetupIntegration:
     """Simplified integration test for the setup command flow."""
 
+    @pytest.fixture(autouse=True)
+    def block_file_writes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Stub out file writes so no test can modify real configuration files."""
+        monkeypatch.setattr("pathlib.Path.write_text", _noop)
+        monkeypatch.setattr("pathlib.Path.mkdir", _noop)
+        monkeypatch.setattr("json.dump", _noop)
+        # open() is used as a context manager, so it needs a MagicMock
+        monkeypatch.setattr("builtins.open", MagicMock())
+
+    @pytest.fixture
+    def all_paths_exist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Report every path as existing, for tests using non-local paths."""
+        monkeypatch.setattr("pathlib.Path.exists", lambda self, *args, **kwargs: True)
+
+    def test_registry_serves_builtin_configs(self) -> None:
+        """Test that the registry returns the built-in server configurations.
+
+        The remaining tests use MCP_CODE_CHECKER and MCP_FILESYSTEM_SERVER
+        directly instead of looking them up in every test.
+        """
+        assert registry.get("mcp-code-checker") is MCP_CODE_CHECKER
+        assert registry.get("mcp-server-filesystem") is MCP_FILESYSTEM_SERVER
+
     def test_setup_generates_correct_config(self) -> None:
         """Test that setup generates the expected JSON configuration entry (safe, no file modifications)."""
 
         # Basic test parameters
-        server_type = "mcp-code-checker"
         server_name = "checker on p mcp-config"
 
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -36,63 +63,53 @@ class TestMCPSetupIntegration:
                 "log_level": "INFO",
             }
 
-            # Get server configuration from registry
-            server_config = registry.get(server_type)
-            assert server_config is not None, f"Server type {server_type} not found"
-
-            # Mock any file operations to prevent real file modifications
-            with (
-                patch("pathlib.Path.write_text"),
-                patch("pathlib.Path.mkdir"),
-                patch("builtins.open"),
-                patch("json.dump"),
-            ):
-
-                # Generate the client configuration (safely mocked)
-                config = generate_client_config(
-                    server_config=server_config,
-                    _server_name=server_name,
-                    user_params=user_params,
-                    python_executable=sys.executable,
-                )
-
-                # Create the final JSON entry that would go into the client config
-                json_entry = {
-                    server_name: {
-                        "command": config["command"],
-                        "args": config["args"],
-                        "env": config["env"],
-                    }
+            server_config = MCP_CODE_CHECKER
+
+            # Generate the client configuration (safely mocked)
+            config = generate_client_config(
+                server_config=server_config,
+                _server_name=server_name,
+                user_params=user_params,
+                python_executable=sys.executable,
+            )
+
+            # Create the final JSON entry that would go into the client config
+            json_entry = {
+                server_name: {
+                    "command": config["command"],
+                    "args": config["args"],
+                    "env": config["env"],
                 }
+            }
 
-                # Verify basic structure
-                entry = json_entry[server_name]
-                assert "command" in entry
-                assert "args" in entry
-                assert "env" in entry
+            # Verify basic structure
+            entry = json_entry[server_name]
+            assert "command" in entry
+            assert "args" in entry
+            assert "env" in entry
 
-                # Verify required arguments are present
-                args = entry["args"]
-                assert "--project-dir" in args
-                assert str(project_dir) in args
-                assert "--log-level" in args
-                assert "INFO" in args
+            # Verify required arguments are present
+            args = entry["args"]
+            assert "--project-dir" in args
+            assert str(project_dir) in args
+            assert "--log-level" in args
+            assert "INFO" in args
 
-                # Verify environment has PYTHONPATH
-                assert "PYTHONPATH" in entry["env"]
+            # Verify environment has PYTHONPATH
+            assert "PYTHONPATH" in entry["env"]
 
-                # Verify it's JSON serializable
-                json_str = json.dumps(json_entry, indent=2)
-                parsed = json.loads(json_str)
-                assert server_name in parsed
+            # Verify it's JSON serializable
+            json_str = json.dumps(json_entry, indent=2)
+            parsed = json.loads(json_str)
+            assert server_name in parsed
 
-                print(f"Generated configuration (safely tested):")
-                print(json_str)
+            print(f"Generated configuration (safely tested):")
+            print(json_str)
 
+    @pytest.mark.usefixtures("all_paths_exist")
     def test_with_realistic_paths(self) -> None:
         """Test with paths similar to the user's actual configuration (safely mocked)."""
 
-        server_type = "mcp-code-checker"
         server_name = "checker on p mcp-config"
 
         # Mock realistic Windows paths
@@ -107,29 +124,72 @@ class TestMCPSetupIntegration:
             "log_level": "INFO",
         }
 
-        server_config = registry.get(server_type)
-        assert server_config is not None
+        server_config = MCP_CODE_CHECKER
+
+        config = generate_client_config(
+            server_config=server_config,
+            _server_name=server_name,
+            user_params=user_params,
+            python_executable=python_exe,
+        )
+
+        # Create the expected JSON structure
+        json_entry = {
+            server_name: {
+                "command": config["command"],
+                "args": config["args"],
+                "env": config["env"],
+            }
+        }
 
-        # Mock all file operations to prevent any real file modifications
-        with (
-            patch("pathlib.Path.write_text"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists") as mock_exists,
-            patch("builtins.open"),
-            patch("json.dump"),
-        ):
+        # Verify essential elements
+        entry = json_entry[server_name]
+        assert isinstance(entry["command"], str)
+        assert isinstance(entry["args"], list)
+        assert isinstance(entry["env"], dict)
 
-            # Mock path existence checks
-            mock_exists.return_value = True
+        # Check required parameters exist
+        args = entry["args"]
+        assert "--project-dir" in args
+        assert "--log-level" in args
+        assert "INFO" in args
 
+        # Check PYTHONPATH is set
+        assert "PYTHONPATH" in entry["env"]
+
+        print(f"\nRealistic configuration (safely tested):")
+        print(json.dumps(json_entry, indent=2))
+
+    def test_filesystem_server_setup_generates_correct_config(
+        self, patched_find_cli: dict[str, str]
+    ) -> None:
+        """Test that filesystem server setup generates the expected JSON configuration entry."""
+
+        # Basic test parameters for filesystem server
+        server_name = "fs on p config"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_dir = Path(tmp_dir)
+
+            # User parameters (similar to what would come from CLI)
+            user_params = {
+                "project_dir": str(project_dir),
+                "log_level": "INFO",
+            }
+
+            server_config = MCP_FILESYSTEM_SERVER
+            # Mock CLI availability
+            patched_find_cli["mcp-server-filesystem"] = "mcp-server-filesystem"
+
+            # Generate the client configuration (safely mocked)
             config = generate_client_config(
                 server_config=server_config,
                 _server_name=server_name,
                 user_params=user_params,
-                python_executable=python_exe,
+                python_executable=sys.executable,
             )
 
-            # Create the expected JSON structure
+            # Create the final JSON entry that would go into the client config
             json_entry = {
                 server_name: {
                     "command": config["command"],
@@ -138,102 +198,37 @@ class TestMCPSetupIntegration:
                 }
             }
 
-            # Verify essential elements
+            # Verify basic structure
             entry = json_entry[server_name]
-            assert isinstance(entry["command"], str)
-            assert isinstance(entry["args"], list)
-            assert isinstance(entry["env"], dict)
+            assert "command" in entry
+            assert "args" in entry
+            assert "env" in entry
 
-            # Check required parameters exist
+            # Verify required arguments are present
             args = entry["args"]
             assert "--project-dir" in args
+            assert str(project_dir) in args
             assert "--log-level" in args
             assert "INFO" in args
 
-            # Check PYTHONPATH is set
+            # Verify environment has PYTHONPATH
             assert "PYTHONPATH" in entry["env"]
 
-            print(f"\nRealistic configuration (safely tested):")
-            print(json.dumps(json_entry, indent=2))
-
-    def test_filesystem_server_setup_generates_correct_config(self) -> None:
-        """Test that filesystem server setup generates the expected JSON configuration entry."""
-
-        # Basic test parameters for filesystem server
-        server_type = "mcp-server-filesystem"
-        server_name = "fs on p config"
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_dir = Path(tmp_dir)
-
-            # User parameters (similar to what would come from CLI)
-            user_params = {
-                "project_dir": str(project_dir),
-                "log_level": "INFO",
-            }
-
-            # Get server configuration from registry
-            server_config = registry.get(server_type)
-            assert server_config is not None, f"Server type {server_type} not found"
-
-            # Mock any file operations to prevent real file modifications
-            with (
-                patch("pathlib.Path.write_text"),
-                patch("pathlib.Path.mkdir"),
-                patch("builtins.open"),
-                patch("json.dump"),
-                patch(
-                    "src.mcp_config.integration._find_cli_executable",
-                    return_value="mcp-server-filesystem",
-                ),  # Mock CLI availability
-            ):
-
-                # Generate the client configuration (safely mocked)
-                config = generate_client_config(
-                    server_config=server_config,
-                    _server_name=server_name,
-                    user_params=user_params,
-                    python_executable=sys.executable,
-                )
-
-                # Create the final JSON entry that would go into the client config
-                json_entry = {
-                    server_name: {
-                        "command": config["command"],
-                        "args": config["args"],
-                        "env": config["env"],
-                    }
-                }
-
-                # Verify basic structure
-                entry = json_entry[server_name]
-                assert "command" in entry
-                assert "args" in entry
-                assert "env" in entry
-
-                # Verify required arguments are present
-                args = entry["args"]
-                assert "--project-dir" in args
-                assert str(project_dir) in args
-                assert "--log-level" in args
-                assert "INFO" in args
+            # Verify it's JSON serializable
+            json_str = json.dumps(json_entry, indent=2)
+            parsed = json.loads(json_str)
+            assert server_name in parsed
 
-                # Verify environment has PYTHONPATH
-                assert "PYTHONPATH" in entry["env"]
-
-                # Verify it's JSON serializable
-                json_str = json.dumps(json_entry, indent=2)
-                parsed = json.loads(json_str)
-                assert server_name in parsed
-
-                print(f"Generated filesystem server configuration (safely tested):")
-                print(json_str)
+            print(f"Generated filesystem server configuration (safely tested):")
+            print(json_str)
 
     @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific path test")
-    def test_filesystem_server_with_realistic_windows_paths(self) -> None:
+    @pytest.mark.usefixtures("all_paths_exist")
+    def test_filesystem_server_with_realistic_windows_paths(
+        self, patched_find_cli: dict[str, str]
+    ) -> None:
         """Test filesystem server with realistic Windows paths matching the example."""
 
-        server_type = "mcp-server-filesystem"
         server_name = "fs on p config"
 
         # Use current user's username dynamically
@@ -250,81 +245,65 @@ class TestMCPSetupIntegration:
             "log_level": "INFO",
         }
 
-        server_config = registry.get(server_type)
-        assert server_config is not None
-
-        # Mock all file operations to prevent any real file modifications
-        with (
-            patch("pathlib.Path.write_text"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists") as mock_exists,
-            patch("builtins.open"),
-            patch("json.dump"),
-            patch(
-                "src.mcp_config.integration._find_cli_executable", return_value=cli_exe
-            ),  # Mock CLI command availability
-        ):
-
-            # Mock path existence checks
-            mock_exists.return_value = True
-
-            # Function will automatically detect CLI mode when mocked
-            config = generate_client_config(
-                server_config=server_config,
-                _server_name=server_name,
-                user_params=user_params,
-            )
-
-            # Create the expected JSON structure matching the example
-            json_entry = {
-                server_name: {
-                    "command": config["command"],
-                    "args": config["args"],
-                    "env": config["env"],
-                }
+        server_config = MCP_FILESYSTEM_SERVER
+        # Mock CLI command availability
+        patched_find_cli["mcp-server-filesystem"] = cli_exe
+
+        # Function will automatically detect CLI mode when mocked
+        config = generate_client_config(
+            server_config=server_config,
+            _server_name=server_name,
+            user_params=user_params,
+        )
+
+        # Create the expected JSON structure matching the example
+        json_entry = {
+            server_name: {
+                "command": config["command"],
+                "args": config["args"],
+                "env": config["env"],
             }
+        }
 
-            # Verify structure matches the example
-            entry = json_entry[server_name]
-            assert isinstance(entry["command"], str)
-            assert isinstance(entry["args"], list)
-            assert isinstance(entry["env"], dict)
-
-            # Check that command contains filesystem server reference or Python
-            # When CLI is mocked as available, it will be used, otherwise Python module mode
-            if "mcp-server-filesystem" in entry["command"]:
-                # CLI command mode
-                assert entry["command"] == cli_exe
-            else:
-                # Python module mode fallback
-                assert entry["command"] == sys.executable
-                assert entry["args"][0] == "-m"
-                assert entry["args"][1] == "mcp_server_filesystem"
-
-            # Check required parameters exist and match example structure
-            args = entry["args"]
-            assert "--project-dir" in args
-            assert project_dir in args
-            assert "--log-level" in args
-            assert "INFO" in args
-
-            # Check PYTHONPATH is set correctly for Windows
-            assert "PYTHONPATH" in entry["env"]
-            pythonpath = entry["env"]["PYTHONPATH"]
-            assert project_dir in pythonpath
-            # On Windows, should end with backslash
-            if sys.platform == "win32":
-                assert pythonpath.endswith("\\")
-
-            print(
-                f"\nFilesystem server realistic Windows configuration (safely tested):"
-            )
-            print(json.dumps(json_entry, indent=2))
-
+        # Verify structure matches the example
+        entry = json_entry[server_name]
+        assert isinstance(entry["command"], str)
+        assert isinstance(entry["args"], list)
+        assert isinstance(entry["env"], dict)
+
+        # Check that command contains filesystem server reference or Python
+        # When CLI is mocked as available, it will be used, otherwise Python module mode
+        if "mcp-server-filesystem" in entry["command"]:
+            # CLI command mode
+            assert entry["command"] == cli_exe
+        else:
+            # Python module mode fallback
+            assert entry["command"] == sys.executable
+            assert entry["args"][0] == "-m"
+            assert entry["args"][1] == "mcp_server_filesystem"
+
+        # Check required parameters exist and match example structure
+        args = entry["args"]
+        assert "--project-dir" in args
+        assert project_dir in args
+        assert "--log-level" in args
+        assert "INFO" in args
+
+        # Check PYTHONPATH is set correctly for Windows
+        assert "PYTHONPATH" in entry["env"]
+        pythonpath = entry["env"]["PYTHONPATH"]
+        assert project_dir in pythonpath
+        # On Windows, should end with backslash
+        if sys.platform == "win32":
+            assert pythonpath.endswith("\\")
+
+        print(f"\nFilesystem server realistic Windows configuration (safely tested):")
+        print(json.dumps(json_entry, indent=2))
+
+    @pytest.mark.usefixtures("all_paths_exist")
     def test_filesystem_server_parameter_combinations(self) -> None:
         """Test filesystem server setup with different parameter combinations."""
 
-        server_type = "mcp-server-filesystem"
         server_name = "test-filesystem"
 
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -343,57 +322,43 @@ class TestMCPSetupIntegration:
                 "log_file": str(log_file),
             }
 
-            server_config = registry.get(server_type)
-            assert server_config is not None
-
-            # Mock file operations
-            with (
-                patch("pathlib.Path.write_text"),
-                patch("pathlib.Path.mkdir"),
-                patch("pathlib.Path.exists") as mock_exists,
-                patch("builtins.open"),
-                patch("json.dump"),
-            ):
-
-                mock_exists.return_value = True
-
-                # Test minimal config
-                config_minimal = generate_client_config(
-                    server_config=server_config,
-                    _server_name=f"{server_name}-minimal",
-                    user_params=user_params_minimal,
-                )
-
-                # Should have default log level
-                assert "--log-level" in config_minimal["args"]
-                assert "INFO" in config_minimal["args"]
-                # log-file should NOT be auto-detected (only included when explicitly provided)
-                # The design is that servers handle log file generation internally
-                assert "--log-file" not in config_minimal["args"]
-
-                # Test full config
-                config_full = generate_client_config(
-                    server_config=server_config,
-                    _server_name=f"{server_name}-full",
-                    user_params=user_params_full,
-                )
-
-                # Should have all specified parameters
-                args = config_full["args"]
-                assert "--project-dir" in args
-                assert "--log-level" in args
-                assert "DEBUG" in args
-                assert "--log-file" in args
-                assert "filesystem.log" in " ".join(args)
-
-                print("✓ Filesystem server parameter combinations tested successfully")
+            server_config = MCP_FILESYSTEM_SERVER
+
+            # Test minimal config
+            config_minimal = generate_client_config(
+                server_config=server_config,
+                _server_name=f"{server_name}-minimal",
+                user_params=user_params_minimal,
+            )
+
+            # Should have default log level
+            assert "--log-level" in config_minimal["args"]
+            assert "INFO" in config_minimal["args"]
+            # log-file should NOT be auto-detected (only included when explicitly provided)
+            # The design is that servers handle log file generation internally
+            assert "--log-file" not in config_minimal["args"]
+
+            # Test full config
+            config_full = generate_client_config(
+                server_config=server_config,
+                _server_name=f"{server_name}-full",
+                user_params=user_params_full,
+            )
+
+            # Should have all specified parameters
+            args = config_full["args"]
+            assert "--project-dir" in args
+            assert "--log-level" in args
+            assert "DEBUG" in args
+            assert "--log-file" in args
+            assert "filesystem.log" in " ".join(args)
+
+            print("✓ Filesystem server parameter combinations tested successfully")
 
     def test_filesystem_server_parameter_validation_errors(self) -> None:
         """Test filesystem server parameter validation error handling."""
 
-        server_type = "mcp-server-filesystem"
-        server_config = registry.get(server_type)
-        assert server_config is not None
+        server_config = MCP_FILESYSTEM_SERVER
 
         # Test missing required parameter
         user_params_missing = {"log_level": "INFO"}  # Missing project_dir
@@ -4,10 +4,8 @@ import os
 import queue
 import subprocess
 import sys
-import tempfile
 import threading
 from pathlib import Path
-from typing import Generator
 from unittest.mock import patch
 
 import pytest
@@ -22,36 +20,6 @@ from src.utils.subprocess_runner import (
 )
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    import gc
-    import time
-
-    tmp_dir_obj = tempfile.TemporaryDirectory()
-    tmp_path = Path(tmp_dir_obj.name)
-
-    try:
-        yield tmp_path
-    finally:
-        # Force garbage collection and add delay on Windows to ensure file handles are released
-        if os.name == "nt":
-            gc.collect()
-            time.sleep(0.5)  # Give Windows time to release file handles
-
-        # Try to clean up, but ignore errors on Windows
-        try:
-            tmp_dir_obj.cleanup()
-        except (PermissionError, OSError) as e:
-            if os.name == "nt":
-                # This is expected on Windows sometimes
-                import warnings
-
-                warnings.warn(f"Could not clean up temp directory {tmp_path}: {e}")
-            else:
-                raise
-
-
 class TestCommandResult:
     """Tests for CommandResult dataclass."""
 
@@ -152,10 +120,10 @@ class TestExecuteSubprocess:
         assert result.execution_time_ms is not None
         assert result.execution_time_ms > 0
 
-    def test_execute_command_with_options(self, temp_dir: Path) -> None:
+    def test_execute_command_with_options(self, tmp_path: Path) -> None:
         """Test executing a command with custom options."""
         options = CommandOptions(
-            cwd=str(temp_dir),
+            cwd=str(tmp_path),
             timeout_seconds=30,
             env={"TEST_VAR": "test_value"},
         )
@@ -283,17 +251,17 @@ class TestConvenienceFunctions:
         assert "test" in result.stdout
         assert result.runner_type == "subprocess"
 
-    def test_execute_command_with_params(self, temp_dir: Path) -> None:
+    def test_execute_command_with_params(self, tmp_path: Path) -> None:
         """Test execute_command with custom parameters."""
         result = execute_command(
             [sys.executable, "-c", "import os; print(os.getcwd())"],
-            cwd=str(temp_dir),
+            cwd=str(tmp_path),
             timeout_seconds=30,
             env={"TEST": "value"},
         )
 
         assert result.return_code == 0
-        assert str(temp_dir) in result.stdout
+        assert str(tmp_path) in result.stdout
         assert result.runner_type == "subprocess"
 
 
@@ -345,10 +313,10 @@ class TestSTDIOIsolation:
         for cmd in non_python_commands:
             assert not is_python_command(cmd), f"Incorrectly detected as Python: {cmd}"
 
-    def test_python_subprocess_with_isolation(self, temp_dir: Path) -> None:
+    def test_python_subprocess_with_isolation(self, tmp_path: Path) -> None:
         """Test successful Python subprocess execution with automatic STDIO isolation."""
         # Create test script
-        test_script = temp_dir / "test_script.py"
+        test_script = tmp_path / "test_script.py"
         test_script.write_text(
             "import sys\n"
             "print('Hello from subprocess')\n"
@@ -357,7 +325,7 @@ class TestSTDIOIsolation:
         )
 
         command = [sys.executable, "-u", str(test_script), "arg1", "arg2"]
-        options = CommandOptions(cwd=str(temp_dir), timeout_seconds=5)
+        options = CommandOptions(cwd=str(tmp_path), timeout_seconds=5)
 
         result = execute_subprocess(command, options)
 
@@ -366,9 +334,9 @@ class TestSTDIOIsolation:
         assert "Args: ['arg1', 'arg2']" in result.stdout
         assert result.stderr == ""
 
-    def test_python_subprocess_with_error(self, temp_dir: Path) -> None:
+    def test_python_subprocess_with_error(self, tmp_path: Path) -> None:
         """Test Python subprocess that writes to stderr."""
-        test_script = temp_dir / "error_script.py"
+        test_script = tmp_path / "error_script.py"
         test_script.write_text(
             "import sys\n"
             "print('Normal output')\n"
@@ -377,7 +345,7 @@ class TestSTDIOIsolation:
         )
 
         command = [sys.executable, "-u", str(test_script)]
-        options = CommandOptions(cwd=str(temp_dir), timeout_seconds=5)
+        options = CommandOptions(cwd=str(tmp_path), timeout_seconds=5)
 
         result = execute_subprocess(command, options)
 
@@ -385,15 +353,15 @@ class TestSTDIOIsolation:
         assert "Normal output" in result.stdout
         assert "Error message" in result.stderr
 
-    def test_python_subprocess_timeout(self, temp_dir: Path) -> None:
+    def test_python_subprocess_timeout(self, tmp_path: Path) -> None:
         """Test subprocess timeout handling."""
-        test_script = temp_dir / "timeout_script.py"
+        test_script = tmp_path / "timeout_script.py"
         test_script.write_text(
             "import time\n" "time.sleep(10)\n" "print('Should not reach here')\n"
         )
 
         command = [sys.executable, "-u", str(test_script)]
-        options = CommandOptions(cwd=str(temp_dir), timeout_seconds=1)
+        options = CommandOptions(cwd=str(tmp_path), timeout_seconds=1)
 
         result = execute_subprocess(command, options)
 
@@ -442,9 +410,9 @@ class TestSTDIOIsolation:
             os.environ.clear()
             os.environ.update(original_env)
 
-    def test_environment_merging(self, temp_dir: Path) -> None:
+    def test_environment_merging(self, tmp_path: Path) -> None:
         """Test that provided environment variables are merged with isolation settings."""
-        test_script = temp_dir / "env_test.py"
+        test_script = tmp_path / "env_test.py"
         test_script.write_text(
             "import os\n"
             "print('CUSTOM_VAR:', os.environ.get('CUSTOM_VAR', 'NOT_SET'))\n"
@@ -453,7 +421,7 @@ class TestSTDIOIsolation:
 
         command = [sys.executable, "-u", str(test_script)]
         options = CommandOptions(
-            cwd=str(temp_dir), timeout_seconds=5, env={"CUSTOM_VAR": "test_value"}
+            cwd=str(tmp_path), timeout_seconds=5, env={"CUSTOM_VAR": "test_value"}
         )
 
         result = execute_subprocess(command, options)
@@ -466,10 +434,10 @@ class TestSTDIOIsolation:
 class TestPythonCommandDetection:
     """Test automatic Python command detection and STDIO isolation."""
 
-    def test_python_command_uses_isolation(self, temp_dir: Path) -> None:
+    def test_python_command_uses_isolation(self, tmp_path: Path) -> None:
         """Test that Python commands automatically use STDIO isolation."""
         # Create a test script that outputs environment info
-        test_script = temp_dir / "test_isolation.py"
+        test_script = tmp_path / "test_isolation.py"
         test_script.write_text(
             "import os\n"
             "print('PYTHONUNBUFFERED:', os.environ.get('PYTHONUNBUFFERED', 'NOT_SET'))\n"
@@ -524,12 +492,12 @@ class TestPythonCommandDetection:
 class TestIntegrationScenarios:
     """Integration tests simulating real scenarios."""
 
-    def test_multiple_sequential_python_commands(self, temp_dir: Path) -> None:
+    def test_multiple_sequential_python_commands(self, tmp_path: Path) -> None:
         """Test multiple sequential Python commands with STDIO isolation."""
         # Create multiple test scripts
         scripts = []
         for i in range(3):
-            script = temp_dir / f"script_{i}.py"
+            script = tmp_path / f"script_{i}.py"
             script.write_text(f"print('Script {i} output')\n")
             scripts.append(script)
 
@@ -538,7 +506,7 @@ class TestIntegrationScenarios:
             command = [sys.executable, "-u", str(script)]
             result = execute_command(
                 command=command,
-                cwd=str(temp_dir),
+                cwd=str(tmp_path),
                 timeout_seconds=30,  # Increased timeout for Windows STDIO isolation
                 env={
                     "_DISABLE_STDIO_ISOLATION": "1"
@@ -551,10 +519,10 @@ class TestIntegrationScenarios:
             assert result.return_code == 0
             assert f"Script {i} output" in result.stdout
 
-    def test_mixed_command_types_sequential(self, temp_dir: Path) -> None:
+    def test_mixed_command_types_sequential(self, tmp_path: Path) -> None:
         """Test mixed Python and non-Python commands in sequence."""
         # Create Python script
-        python_script = temp_dir / "python_test.py"
+        python_script = tmp_path / "python_test.py"
         python_script.write_text("print('Python output')\n")
 
         commands = [
@@ -570,7 +538,7 @@ class TestIntegrationScenarios:
         results = []
         for command in commands:
             result = execute_command(
-                command=command, cwd=str(temp_dir), timeout_seconds=5
+                command=command, cwd=str(tmp_path), timeout_seconds=5
             )
             results.append(result)
 
@@ -581,9 +549,9 @@ class TestIntegrationScenarios:
         assert results[1].return_code == 0
         assert "Non-Python output" in results[1].stdout
 
-    def test_concurrent_subprocess_simulation(self, temp_dir: Path) -> None:
+    def test_concurrent_subprocess_simulation(self, tmp_path: Path) -> None:
         """Test behavior under concurrent subprocess scenarios."""
-        test_script = temp_dir / "concurrent_test.py"
+        test_script = tmp_path / "concurrent_test.py"
         test_script.write_text(
             "import time\n"
             "import sys\n"
@@ -607,7 +575,7 @@ class TestIntegrationScenarios:
                 command = [sys.executable, "-u", str(test_script), str(thread_id)]
                 result = execute_command(
                     command=command,
-                    cwd=str(temp_dir),
+                    cwd=str(tmp_path),
                     timeout_seconds=10,  # Increased timeout
                 )
                 results_queue.put((thread_id, result))
@@ -641,7 +609,7 @@ class TestIntegrationScenarios:
             assert f"Thread {thread_id} started" in result.stdout
             assert f"Thread {thread_id} finished" in result.stdout
 
-    def test_environment_variable_isolation_integration(self, temp_dir: Path) -> None:
+    def test_environment_variable_isolation_integration(self, tmp_path: Path) -> None:
         """Test that environment variable isolation works in integration scenarios."""
         # Set up some environment variables that could interfere
         original_env = os.environ.copy()
@@ -650,7 +618,7 @@ class TestIntegrationScenarios:
             os.environ["MCP_STDIO_TRANSPORT"] = "test_transport"
             os.environ["CUSTOM_TEST_VAR"] = "should_be_preserved"
 
-            test_script = temp_dir / "env_isolation_test.py"
+            test_script = tmp_path / "env_isolation_test.py"
             test_script.write_text(
                 "import os\n"
                 "import sys\n"
@@ -668,7 +636,7 @@ class TestIntegrationScenarios:
 
             result = execute_command(
                 command=command,
-                cwd=str(temp_dir),
+                cwd=str(tmp_path),
                 timeout_seconds=10,  # Increased timeout
                 env={
                     "CUSTOM_TEST_VAR": "should_be_preserved"